@@ -0,0 +1,351 @@
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import discord
+
+from discord.ext.paginators import (
+    AdaptiveController,
+    BasePages,
+    DefaultController,
+    EmbedFieldsPaginator,
+    EmbedsPaginator,
+    EmbedTextPaginator,
+    PartialPaginator,
+    TextPaginator,
+    build_pages,
+)
+
+from .fakes import FakeContext
+
+
+Operation = Callable[[], Awaitable[Any]]
+Setup = Callable[[], Awaitable[Operation]]
+Session = Callable[[FakeContext], Any]
+
+BENCHMARKS: dict[str, Setup] = {}
+# name -> (session factory, budget in bytes per session)
+SESSIONS: dict[str, tuple[Session, int]] = {}
+
+ITEMS: list[str] = [f"{x:>6} | user-{x * 7919 % 100000:05} | {x * 31 % 9973} points" for x in range(200_000)]
+
+
+def benchmark(name: str, /) -> Callable[[Setup], Setup]:
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def session(name: str, /, *, budget: int) -> Callable[[Session], Session]:
+    def decorator(factory: Session) -> Session:
+        SESSIONS[name] = (factory, budget)
+        return factory
+    return decorator
+
+
+# page construction
+
+@benchmark("pages.eager")
+async def _() -> Operation:
+    async def operation() -> None:
+        build_pages(ITEMS, items_per_page=20)
+    return operation
+
+
+@benchmark("pages.lazy")
+async def _() -> Operation:
+    async def operation() -> None:
+        pages = build_pages(ITEMS, items_per_page=20, lazy=True)
+        pages[0], pages[1], pages[-1]
+    return operation
+
+
+@benchmark("pages.stream")
+async def _() -> Operation:
+    async def operation() -> None:
+        pages = build_pages(iter(ITEMS), items_per_page=20)
+        await pages.load(3)
+    return operation
+
+
+@benchmark("pages.packed")
+async def _() -> Operation:
+    async def operation() -> None:
+        build_pages(ITEMS, items_per_page=1000, max_page_length=1900)
+    return operation
+
+
+# rendering
+
+def _cycle(paginator: Any, /) -> Operation:
+    async def operation() -> None:
+        paginator.page = paginator.page % len(paginator.pages) + 1
+        await paginator.update_page_content()
+    return operation
+
+
+@benchmark("render.text")
+async def _() -> Operation:
+    return _cycle(TextPaginator(ctx=FakeContext(), items=ITEMS[:2000], items_per_page=20, registry=None))
+
+
+@benchmark("render.embed_text")
+async def _() -> Operation:
+    return _cycle(
+        EmbedTextPaginator(
+            ctx=FakeContext(), items=ITEMS[:2000], items_per_page=20, registry=None,
+            embed=discord.Embed(title="leaderboard", colour=0x5865F2).set_footer(text="footer"),
+        )
+    )
+
+
+@benchmark("render.fields")
+async def _() -> Operation:
+    return _cycle(
+        EmbedFieldsPaginator(
+            ctx=FakeContext(), fields=[(item[:10], item, True) for item in ITEMS[:2000]], fields_per_page=25,
+            registry=None, embed=discord.Embed(title="leaderboard"),
+        )
+    )
+
+
+@benchmark("render.embeds")
+async def _() -> Operation:
+    return _cycle(
+        EmbedsPaginator(
+            ctx=FakeContext(), embeds=[discord.Embed(description=item) for item in ITEMS[:2000]], embeds_per_page=5,
+            registry=None,
+        )
+    )
+
+
+@benchmark("render.partial")
+async def _() -> Operation:
+    async def partial() -> str:
+        return "content"
+    # through start and change_page, so that it renders the way a running paginator does
+    paginator = PartialPaginator(ctx=FakeContext(), partials=[partial] * 100, registry=None)
+    await paginator.start()
+    async def operation() -> None:
+        await paginator.change_page(paginator.page % len(paginator.pages) + 1)
+    return operation
+
+
+# controllers
+
+@benchmark("controller.create")
+async def _() -> Operation:
+    paginator = TextPaginator(ctx=FakeContext(), items=ITEMS[:2000], items_per_page=20, registry=None)
+    async def operation() -> None:
+        DefaultController(paginator)
+    return operation
+
+
+@benchmark("controller.update_item_states")
+async def _() -> Operation:
+    paginator = TextPaginator(ctx=FakeContext(), items=ITEMS[:2000], items_per_page=20, registry=None)
+    controller = DefaultController(paginator)
+    async def operation() -> None:
+        paginator.page = paginator.page % len(paginator.pages) + 1
+        controller.update_item_states()
+    return operation
+
+
+@benchmark("controller.adaptive_item_states")
+async def _() -> Operation:
+    paginator = TextPaginator(ctx=FakeContext(), items=ITEMS[:20000], items_per_page=20, registry=None)
+    controller = AdaptiveController(paginator)
+    async def operation() -> None:
+        paginator.page = paginator.page % len(paginator.pages) + 1
+        controller.update_item_states()
+    return operation
+
+
+# navigation
+
+@benchmark("navigation.session")
+async def _() -> Operation:
+    async def stop(_: Any) -> None:
+        return
+    async def operation() -> None:
+        paginator = TextPaginator(ctx=FakeContext(), items=ITEMS[:2000], items_per_page=20, registry=None)
+        await paginator.start()
+        for _ in range(20):
+            await paginator.go_to_next_page()
+        await paginator.go_to_last_page()
+        await paginator.go_to_first_page()
+        await paginator.stop(callback=stop)
+    return operation
+
+
+# session memory
+#
+# the memory each started paginator holds on to, its paginator, pages, controller, and
+# message state. sessions use lazy pages with a single built page so that the figures
+# aren't dominated by how many items are being paginated, and share their items list as
+# it belongs to the caller. '--check' fails the run if any of them go over their budget,
+# so raise these deliberately rather than to make it pass.
+
+SESSION_ITEMS: list[str] = ITEMS[:2000]
+SESSION_PAGES: BasePages = build_pages(SESSION_ITEMS, items_per_page=20)
+SESSION_FIELDS: list[tuple[str, str, bool]] = [(item[:10], item, True) for item in ITEMS[:100]]
+
+@session("session.text", budget=7 * 1024)
+def _(ctx: FakeContext) -> Any:
+    return TextPaginator(ctx=ctx, items=SESSION_ITEMS, items_per_page=20, lazy=True, max_built_pages=1, registry=None)
+
+
+@session("session.text_shared", budget=7 * 1024)
+def _(ctx: FakeContext) -> Any:
+    return TextPaginator(ctx=ctx, items=SESSION_PAGES, items_per_page=20, registry=None)
+
+
+@session("session.embed_text", budget=9 * 1024)
+def _(ctx: FakeContext) -> Any:
+    return EmbedTextPaginator(
+        ctx=ctx, items=SESSION_ITEMS, items_per_page=20, lazy=True, max_built_pages=1, registry=None,
+        embed=discord.Embed(title="leaderboard", colour=0x5865F2).set_footer(text="footer"),
+    )
+
+
+@session("session.fields", budget=8 * 1024)
+def _(ctx: FakeContext) -> Any:
+    return EmbedFieldsPaginator(
+        ctx=ctx, fields=SESSION_FIELDS, fields_per_page=5, lazy=True,
+        max_built_pages=1, registry=None, embed=discord.Embed(title="leaderboard"),
+    )
+
+
+# live pages
+
+@benchmark("live.append")
+async def _() -> Operation:
+    paginator = TextPaginator(ctx=FakeContext(), items=ITEMS[:2000], items_per_page=20, registry=None)
+    await paginator.start()
+    items = iter(ITEMS[2000:])
+    async def operation() -> None:
+        await paginator.append(next(items), follow=True)
+    return operation
+
+
+# runner
+
+async def measure(setup: Setup, /, *, repeat: int, budget: float) -> dict[str, float]:
+    operation = await setup()
+    await operation()
+    # pick a number of iterations that fits the time budget of a single repeat
+    start = time.perf_counter()
+    await operation()
+    number = max(1, int(budget / max(time.perf_counter() - start, 1e-9)))
+    timings: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(number):
+            await operation()
+        timings.append((time.perf_counter() - start) / number)
+    # memory is measured separately as tracing slows everything down
+    gc.collect()
+    tracemalloc.start()
+    await operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": min(timings), "number": number, "peak_bytes": peak}
+
+
+async def measure_session(factory: Session, /, *, sessions: int) -> float:
+    ctx = FakeContext()
+    # warm up so that one-off allocations (interned strings, caches, ...) aren't counted
+    warmup = [factory(ctx) for _ in range(10)]
+    for paginator in warmup:
+        await paginator.start()
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    paginators = []
+    for _ in range(sessions):
+        paginator = factory(ctx)
+        await paginator.start()
+        paginators.append(paginator)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / sessions
+
+
+def commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(arguments: argparse.Namespace) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for name, setup in BENCHMARKS.items():
+        if arguments.filter and arguments.filter not in name:
+            continue
+        results[name] = result = await measure(setup, repeat=arguments.repeat, budget=arguments.budget)
+        print(f"{name:<32} {result['seconds'] * 1e6:>12.2f} us {result['peak_bytes'] / 1024:>12.1f} KiB", flush=True)
+    sessions: dict[str, Any] = {}
+    for name, (factory, budget) in SESSIONS.items():
+        if arguments.filter and arguments.filter not in name:
+            continue
+        size = await measure_session(factory, sessions=arguments.sessions)
+        sessions[name] = {"bytes": size, "budget": budget}
+        print(f"{name:<32} {size:>12.0f} B  {'over' if size > budget else 'within'} budget of {budget} B", flush=True)
+    return {
+        "commit": commit(),
+        "python": platform.python_version(),
+        "discord.py": discord.__version__,
+        "results": results,
+        "sessions": sessions,
+    }
+
+
+def compare(current: dict[str, Any], previous: dict[str, Any], /) -> None:
+    print(f"\ncompared to {previous.get('commit') or 'previous run'}:")
+    for name, result in current["results"].items():
+        if (old := previous["results"].get(name)) is None:
+            continue
+        time_change = (result["seconds"] / old["seconds"] - 1) * 100
+        memory_change = (result["peak_bytes"] / max(old["peak_bytes"], 1) - 1) * 100
+        print(f"{name:<32} {time_change:>+10.1f}% time {memory_change:>+10.1f}% memory")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="discord-ext-paginators benchmarks")
+    parser.add_argument("-k", "--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="repeats per benchmark, the fastest is reported")
+    parser.add_argument("-b", "--budget", type=float, default=0.2, help="seconds to spend on each repeat")
+    parser.add_argument("-o", "--output", help="write the results as json to this file")
+    parser.add_argument("-c", "--compare", help="compare against results previously written with --output")
+    parser.add_argument("-s", "--sessions", type=int, default=1000, help="sessions to measure memory over")
+    parser.add_argument("--check", action="store_true", help="exit with 1 if any session is over its memory budget")
+    arguments = parser.parse_args()
+
+    results = asyncio.run(run(arguments))
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4)
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf-8") as file:
+            compare(results, json.load(file))
+    if arguments.check and any(result["bytes"] > result["budget"] for result in results["sessions"].values()):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+import asyncio
+import contextlib
+import itertools
+import random
+from collections import Counter
+from collections.abc import AsyncIterator
+from typing import Any
+
+import discord
+
+
+__all__ = [
+    "FakeHTTP",
+    "FakeUser",
+    "FakeChannel",
+    "FakeGuild",
+    "FakeMessage",
+    "FakeContext",
+    "FakeInteraction",
+]
+
+
+_ids = itertools.count(1)
+
+
+class FakeHTTP:
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: float = 0.0,
+        retry_after: float = 1.0,
+        max_ratelimit_timeout: float | None = None,
+        seed: int | None = None,
+    ) -> None:
+        # every request takes 'latency' seconds, give or take 'jitter' of it, and is rate
+        # limited with a chance of 'rate_limit'. like discord.py, rate limited requests are
+        # retried after 'retry_after' seconds, unless that is longer than 'max_ratelimit_timeout'
+        # in which case discord.RateLimited is raised.
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.rate_limit: float = rate_limit
+        self.retry_after: float = retry_after
+        self.max_ratelimit_timeout: float | None = max_ratelimit_timeout
+        self.random: random.Random = random.Random(seed)
+        # request kind -> count, rate limits are counted under '429'
+        self.requests: Counter[str] = Counter()
+
+    async def request(self, kind: str, /) -> None:
+        while True:
+            if self.latency:
+                await asyncio.sleep(self.latency * (1 + self.jitter * self.random.uniform(-1, 1)))
+            if self.rate_limit and self.random.random() < self.rate_limit:
+                self.requests["429"] += 1
+                if self.max_ratelimit_timeout is not None and self.retry_after > self.max_ratelimit_timeout:
+                    raise discord.RateLimited(self.retry_after)
+                await asyncio.sleep(self.retry_after)
+                continue
+            self.requests[kind] += 1
+            return
+
+
+class FakeUser:
+
+    def __init__(self, id: int | None = None) -> None:
+        self.id: int = id if id is not None else next(_ids)
+        self.bot: bool = False
+
+
+class FakeGuild:
+
+    def __init__(self, id: int | None = None) -> None:
+        self.id: int = id if id is not None else next(_ids)
+
+
+class FakeChannel:
+
+    def __init__(self, id: int | None = None, *, guild: FakeGuild | None = None) -> None:
+        self.id: int = id if id is not None else next(_ids)
+        self.guild: FakeGuild | None = guild
+
+    @contextlib.asynccontextmanager
+    async def typing(self) -> AsyncIterator[None]:
+        yield
+
+
+class FakeMessage:
+
+    def __init__(
+        self,
+        *,
+        channel: FakeChannel,
+        latency: float = 0.0,
+        http: FakeHTTP | None = None,
+        **payload: Any,
+    ) -> None:
+        self.id: int = next(_ids)
+        self.channel: FakeChannel = channel
+        self.guild: FakeGuild | None = channel.guild
+        self.latency: float = latency
+        self.http: FakeHTTP | None = http
+        self.payload: dict[str, Any] = payload
+        self.edits: int = 0
+
+    async def edit(self, **payload: Any) -> "FakeMessage":
+        if self.http is not None:
+            await self.http.request("message.edit")
+        elif self.latency:
+            await asyncio.sleep(self.latency)
+        self.payload.update(payload)
+        self.edits += 1
+        return self
+
+    async def delete(self) -> None:
+        if self.http is not None:
+            await self.http.request("message.delete")
+
+
+class FakeContext:
+
+    def __init__(
+        self,
+        *,
+        author: FakeUser | None = None,
+        channel: FakeChannel | None = None,
+        latency: float = 0.0,
+        http: FakeHTTP | None = None,
+    ) -> None:
+        self.author: FakeUser = author or FakeUser()
+        self.channel: FakeChannel = channel or FakeChannel(guild=FakeGuild())
+        self.guild: FakeGuild | None = self.channel.guild
+        self.latency: float = latency
+        self.http: FakeHTTP | None = http
+
+    async def reply(self, **payload: Any) -> FakeMessage:
+        if self.http is not None:
+            await self.http.request("context.reply")
+        elif self.latency:
+            await asyncio.sleep(self.latency)
+        return FakeMessage(channel=self.channel, latency=self.latency, http=self.http, **payload)
+
+    def typing(self) -> contextlib.AbstractAsyncContextManager[None]:
+        return self.channel.typing()
+
+
+class FakeInteractionResponse:
+
+    def __init__(self, interaction: "FakeInteraction") -> None:
+        self._interaction: FakeInteraction = interaction
+        self._done: bool = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _respond(self, kind: str, /) -> None:
+        if self._done:
+            raise discord.InteractionResponded(self._interaction)  # type: ignore
+        self._done = True
+        await self._interaction.http.request(kind)
+
+    async def defer(self, **_: Any) -> None:
+        await self._respond("response.defer")
+
+    async def edit_message(self, **payload: Any) -> None:
+        await self._respond("response.edit_message")
+        if self._interaction.message is not None:
+            self._interaction.message.payload.update(payload)
+            self._interaction.message.edits += 1
+
+    async def send_message(self, content: str | None = None, /, **payload: Any) -> None:
+        await self._respond("response.send_message")
+        if content is not None:
+            payload["content"] = content
+        self._interaction.sent = FakeMessage(channel=self._interaction.channel, http=self._interaction.http, **payload)
+
+    async def send_modal(self, _: Any, /) -> None:
+        await self._respond("response.send_modal")
+
+
+class FakeFollowup:
+
+    def __init__(self, interaction: "FakeInteraction") -> None:
+        self._interaction: FakeInteraction = interaction
+
+    async def send(self, content: str | None = None, /, **payload: Any) -> FakeMessage:
+        await self._interaction.http.request("followup.send")
+        if content is not None:
+            payload["content"] = content
+        return FakeMessage(channel=self._interaction.channel, http=self._interaction.http, **payload)
+
+
+class FakeInteraction:
+
+    def __init__(self, *, user: FakeUser, message: FakeMessage | None, http: FakeHTTP) -> None:
+        self.id: int = next(_ids)
+        self.user: FakeUser = user
+        self.message: FakeMessage | None = message
+        self.channel: FakeChannel | None = message.channel if message is not None else None
+        self.guild: FakeGuild | None = message.guild if message is not None else None
+        self.http: FakeHTTP = http
+        self.response: FakeInteractionResponse = FakeInteractionResponse(self)
+        self.followup: FakeFollowup = FakeFollowup(self)
+        self.sent: FakeMessage | None = None
+
+    async def original_response(self) -> FakeMessage | None:
+        await self.http.request("original_response")
+        return self.sent or self.message
+
+    async def edit_original_response(self, **payload: Any) -> FakeMessage | None:
+        await self.http.request("edit_original_response")
+        if (message := self.sent or self.message) is not None:
+            message.payload.update(payload)
+            message.edits += 1
+        return message
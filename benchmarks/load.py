@@ -0,0 +1,287 @@
+import argparse
+import asyncio
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any
+
+import discord
+
+from discord.ext.paginators import (
+    AdaptiveController,
+    BasePaginator,
+    DefaultController,
+    FirstPageButton,
+    LastPageButton,
+    NextPageButton,
+    PaginatorRegistry,
+    PreviousPageButton,
+    SkipPagesButton,
+    TextPaginator,
+    build_pages,
+)
+
+from .fakes import FakeContext, FakeHTTP, FakeInteraction, FakeUser
+
+
+# soak test
+#
+# starts thousands of paginators against a fake http layer with latency and injected rate
+# limits, then has their users click through them using the real button callbacks, the way
+# a view dispatches them. reports how many edits got through, how long each click took to
+# be shown, how far the event loop fell behind, and how much memory each session holds.
+
+CONTROLLERS: dict[str, type[Any]] = {
+    "default": DefaultController,
+    "adaptive": AdaptiveController,
+}
+NAVIGATION: tuple[type[discord.ui.Button[Any]], ...] = (
+    FirstPageButton,
+    PreviousPageButton,
+    NextPageButton,
+    LastPageButton,
+    SkipPagesButton,
+)
+
+# requests that show a page, as opposed to defers, rate limits, and fetches
+EDITS: tuple[str, ...] = (
+    "message.edit",
+    "response.edit_message",
+    "response.send_message",
+    "edit_original_response",
+    "followup.send",
+)
+
+# errors that the paginators are meant to raise, anything else fails the run
+EXPECTED_ERRORS: tuple[str, ...] = (
+    "ValueError",
+    "start: HTTPException",
+    "start: RateLimited",
+)
+
+ITEMS: list[str] = [f"{x:>6} | user-{x * 7919 % 100000:05} | {x * 31 % 9973} points" for x in range(20_000)]
+
+
+class Results:
+
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.lag: list[float] = []
+        self.errors: Counter[str] = Counter()
+        self.clicks: int = 0
+
+
+def percentiles(values: list[float], /) -> dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+    if len(values) == 1:
+        return {"p50": values[0], "p90": values[0], "p99": values[0], "max": values[0]}
+    quantiles = statistics.quantiles(values, n=100, method="inclusive")
+    return {"p50": quantiles[49], "p90": quantiles[89], "p99": quantiles[98], "max": max(values)}
+
+
+async def monitor_lag(results: Results, stop: asyncio.Event, /, *, interval: float) -> None:
+    # how much later than asked for the loop wakes us up, i.e. how long other callbacks held it
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        results.lag.append(max(loop.time() - expected, 0.0))
+
+
+async def click(
+    paginator: BasePaginator[Any, Any],
+    user: FakeUser,
+    http: FakeHTTP,
+    results: Results,
+    rng: random.Random,
+    /,
+) -> None:
+    # clicks land on a message showing whatever the user was last sent, which may be
+    # behind if their previous click is still being edited in.
+    interaction = FakeInteraction(user=user, message=paginator.message, http=http)  # type: ignore
+    buttons = [
+        item for item in paginator.view.children
+        if isinstance(item, NAVIGATION) and not item.disabled
+    ]
+    if not buttons:
+        return
+    button = rng.choice(buttons)
+    results.clicks += 1
+    started = time.perf_counter()
+    try:
+        if await paginator.view.interaction_check(interaction):  # type: ignore
+            await button.callback(interaction)  # type: ignore
+    except Exception as error:
+        results.errors[type(error).__name__] += 1
+    else:
+        results.latencies.append(time.perf_counter() - started)
+
+
+async def storm(
+    paginator: BasePaginator[Any, Any],
+    users: list[FakeUser],
+    http: FakeHTTP,
+    results: Results,
+    /,
+    *,
+    clicks: int,
+    burst: int,
+    interval: float,
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    # spread sessions out so that they don't all click in lockstep
+    await asyncio.sleep(rng.uniform(0, interval))
+    for sent in range(0, clicks, burst):
+        # clicks within a burst don't wait for each other, which is where edits get merged
+        await asyncio.gather(*(
+            click(paginator, rng.choice(users), http, results, rng)
+            for _ in range(min(burst, clicks - sent))
+        ))
+        await asyncio.sleep(rng.expovariate(1 / interval) if interval > 0 else 0)
+
+
+async def run(arguments: argparse.Namespace) -> dict[str, Any]:
+    http = FakeHTTP(
+        latency=arguments.latency,
+        jitter=arguments.jitter,
+        rate_limit=arguments.rate_limit,
+        retry_after=arguments.retry_after,
+        max_ratelimit_timeout=arguments.max_ratelimit_timeout,
+        seed=arguments.seed,
+    )
+    registry = PaginatorRegistry()
+    pages = build_pages(ITEMS, items_per_page=20)
+    shared = arguments.viewers > 1
+    results = Results()
+
+    # sessions
+    contexts = [FakeContext(http=http) for _ in range(arguments.sessions)]
+    paginators = [
+        TextPaginator(
+            ctx=ctx, items=pages, items_per_page=20, controller=CONTROLLERS[arguments.controller],
+            timeout=3600.0, edit_delay=arguments.edit_delay, registry=registry, shared=shared,
+        )
+        for ctx in contexts
+    ]
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    starts = await asyncio.gather(*(paginator.start() for paginator in paginators), return_exceptions=True)
+    start_seconds = time.perf_counter() - started
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # sessions whose first message failed to send are left out of the storm
+    for error in starts:
+        if isinstance(error, BaseException):
+            results.errors[f"start: {type(error).__name__}"] += 1
+    sessions = [
+        (ctx, paginator) for ctx, paginator, error in zip(contexts, paginators, starts)
+        if not isinstance(error, BaseException)
+    ]
+    print(f"started {len(sessions)} of {len(paginators)} sessions in {start_seconds:.2f}s", flush=True)
+
+    # click storm
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_lag(results, stop, interval=arguments.lag_interval))
+    edits = sum(http.requests[kind] for kind in EDITS)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        storm(
+            paginator,
+            [ctx.author] + [FakeUser() for _ in range(arguments.viewers - 1)],
+            http, results,
+            clicks=arguments.clicks, burst=arguments.burst, interval=arguments.interval,
+            seed=arguments.seed + index if arguments.seed is not None else index,
+        )
+        for index, (ctx, paginator) in enumerate(sessions)
+    ))
+    storm_seconds = time.perf_counter() - started
+    edits = sum(http.requests[kind] for kind in EDITS) - edits
+    stop.set()
+    await monitor
+    # clicks that failed can leave a late defer behind, let those finish before tearing down.
+    # they start within 3 seconds of the click and take at most one rate limit to go through.
+    await asyncio.sleep(3 + arguments.retry_after + arguments.latency * (1 + arguments.jitter))
+
+    # teardown, timeouts edit the messages through the dispatcher
+    started = time.perf_counter()
+    await registry.stop_all()
+    stop_seconds = time.perf_counter() - started
+
+    return {
+        "sessions": arguments.sessions,
+        "viewers": arguments.viewers,
+        "clicks": results.clicks,
+        "errors": dict(results.errors),
+        "requests": dict(http.requests),
+        "seconds": {"start": start_seconds, "storm": storm_seconds, "stop": stop_seconds},
+        "edits_per_second": edits / storm_seconds if storm_seconds else 0.0,
+        "click_latency": percentiles(results.latencies),
+        "loop_lag": percentiles(results.lag),
+        "bytes_per_session": (after - before) / arguments.sessions,
+    }
+
+
+def report(results: dict[str, Any], /) -> None:
+    print(f"clicks                {results['clicks']:>12}")
+    print(f"errors                {results['errors'] or 'none'}")
+    if "ValueError" in results["errors"]:
+        print("                      (ValueErrors are clicks that went out of range before they landed)")
+    if any(name.startswith("start: ") for name in results["errors"]):
+        print("                      (start errors are first messages that were rate limited or failed to send)")
+    print(f"requests              {results['requests']}")
+    print(f"storm                 {results['seconds']['storm']:>12.2f} s")
+    print(f"edits/s               {results['edits_per_second']:>12.1f}")
+    for name in ("click_latency", "loop_lag"):
+        values = "  ".join(f"{key} {value * 1e3:8.2f} ms" for key, value in results[name].items())
+        print(f"{name:<22}{values}")
+    print(f"memory/session        {results['bytes_per_session']:>12.0f} B")
+    print(f"stop                  {results['seconds']['stop']:>12.2f} s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description="discord-ext-paginators soak test")
+    parser.add_argument("-n", "--sessions", type=int, default=2000, help="paginators to start")
+    parser.add_argument("--viewers", type=int, default=1, help="users clicking each paginator, more than 1 makes them shared")
+    parser.add_argument("--controller", choices=CONTROLLERS, default="adaptive", help="controller to click through")
+    parser.add_argument("--clicks", type=int, default=20, help="clicks per session")
+    parser.add_argument("--burst", type=int, default=3, help="clicks sent at once, without waiting for the previous")
+    parser.add_argument("--interval", type=float, default=0.5, help="mean seconds between bursts")
+    parser.add_argument("--edit-delay", type=float, default=0.0, help="'edit_delay' of the paginators")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds each request takes")
+    parser.add_argument("--jitter", type=float, default=0.5, help="fraction that request latency varies by")
+    parser.add_argument("--rate-limit", type=float, default=0.01, help="chance of a request being rate limited")
+    parser.add_argument("--retry-after", type=float, default=0.5, help="seconds a rate limit lasts")
+    parser.add_argument(
+        "--max-ratelimit-timeout", type=float,
+        help="rate limits longer than this raise discord.RateLimited instead of being waited out",
+    )
+    parser.add_argument("--lag-interval", type=float, default=0.01, help="seconds between event loop lag samples")
+    parser.add_argument("--seed", type=int, help="seed for latency, rate limits and clicks")
+    parser.add_argument("-o", "--output", help="write the results as json to this file")
+    arguments = parser.parse_args()
+    if arguments.sessions <= 0 or arguments.viewers <= 0 or arguments.burst <= 0:
+        parser.error("'--sessions', '--viewers' and '--burst' must be greater than 0.")
+
+    results = asyncio.run(run(arguments))
+    report(results)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4)
+    # clicks sent from a message that is behind can ask for a page that is out of range by the
+    # time they land, which raises a ValueError just like it would on discord. first messages
+    # that couldn't be sent are raised to whoever started the paginator, like any other send.
+    return 1 if any(name not in EXPECTED_ERRORS for name in results["errors"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
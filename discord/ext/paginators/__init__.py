@@ -1,9 +1,19 @@
 from typing import Literal, NamedTuple
 
+from .attachments import *
+from .caches import *
 from .callbacks import *
 from .codeblocks import *
 from .controllers import *
+from .dispatch import *
+from .metrics import *
+from .pages import *
 from .paginators import *
+from .persistence import *
+from .registry import *
+from .renderers import *
+from .search import *
+from .templates import *
 from .types import *
 
 
@@ -0,0 +1,158 @@
+import asyncio
+import hashlib
+import io
+import os
+from collections.abc import Hashable, Iterable
+
+import discord
+
+from .caches import BaseCache, RenderCache
+
+
+__all__ = [
+    "PageFile",
+    "AttachmentStager",
+]
+
+
+class PageFile:
+
+    __slots__ = (
+        "source",
+        "filename",
+        "description",
+        "spoiler",
+        "key",
+    )
+
+    def __init__(
+        self,
+        source: str | os.PathLike[str] | bytes | io.BufferedIOBase,
+        /,
+        *,
+        filename: str | None = None,
+        description: str | None = None,
+        spoiler: bool = False,
+        key: Hashable | None = None,
+    ) -> None:
+        # files are only opened when they are uploaded, and are streamed from disk (or from
+        # the given bytes / file object) rather than being read into memory first.
+        self.source: str | os.PathLike[str] | bytes | io.BufferedIOBase = source
+        if isinstance(source, (str, os.PathLike)):
+            path = os.fspath(source)
+            self.filename: str = filename or os.path.basename(path)
+            self.key: Hashable = key if key is not None else ("path", os.path.abspath(path))
+        else:
+            if filename is None:
+                raise ValueError("'filename' must be given for files that aren't paths.")
+            self.filename = filename
+            if key is not None:
+                self.key = key
+            elif isinstance(source, bytes):
+                self.key = ("sha256", hashlib.sha256(source).hexdigest())
+            else:
+                raise ValueError("'key' must be given for file objects.")
+        self.description: str | None = description
+        self.spoiler: bool = spoiler
+
+    def to_file(self) -> discord.File:
+        # a BytesIO created from bytes shares their buffer instead of copying it. file objects
+        # are read from their start, since a previous upload will have left them at the end.
+        source = self.source
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        elif isinstance(source, io.IOBase) and source.seekable():
+            source.seek(0)
+        return discord.File(source, filename=self.filename, description=self.description, spoiler=self.spoiler)
+
+
+class AttachmentStager:
+
+    # the number of attachments discord allows on a single message
+    MAX_FILES_PER_MESSAGE: int = 10
+
+    def __init__(
+        self,
+        channel: discord.abc.Messageable,
+        /,
+        *,
+        ttl: float | None = 72000.0,
+        cache: BaseCache | None = None,
+        max_concurrent_uploads: int = 2,
+    ) -> None:
+        if max_concurrent_uploads <= 0:
+            raise ValueError("'max_concurrent_uploads' must be greater than 0.")
+        # files are uploaded to messages in this channel, which have to be kept for their
+        # attachment urls to keep working. paginators then only reference the urls.
+        self.channel: discord.abc.Messageable = channel
+        # attachment urls are signed and expire after about a day, so entries should expire
+        # before then, after which the file is uploaded again the next time it is shown.
+        self.cache: BaseCache = cache if cache is not None else RenderCache(ttl=ttl)
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_uploads)
+        self._pending: dict[Hashable, asyncio.Future[str]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        # messages sent to the channel, and files uploaded with them
+        self.uploads: int = 0
+        self.files_uploaded: int = 0
+
+    async def url(self, file: PageFile, /) -> str:
+        if (url := self.cache.get(file.key)) is not None:
+            return url
+        # concurrent requests for a file that is already being uploaded share its upload
+        if file.key not in self._pending:
+            self._start_upload([file])
+        return await asyncio.shield(self._pending[file.key])
+
+    async def stage(self, files: Iterable[PageFile], /) -> list[str]:
+        # files that aren't uploaded yet are batched into as few messages as possible
+        files = list(files)
+        missing = list({
+            file.key: file for file in files
+            if file.key not in self._pending and self.cache.get(file.key) is None
+        }.values())
+        for index in range(0, len(missing), self.MAX_FILES_PER_MESSAGE):
+            self._start_upload(missing[index:index + self.MAX_FILES_PER_MESSAGE])
+        return [await self.url(file) for file in files]
+
+    def invalidate(self, file: PageFile, /) -> None:
+        self.cache.delete(file.key)
+
+    def _start_upload(self, files: list[PageFile], /) -> None:
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[str]] = []
+        for file in files:
+            future: asyncio.Future[str] = loop.create_future()
+            # failed uploads are retried by the next request for the file, so don't warn
+            # about them if nobody was waiting.
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._pending[file.key] = future
+            futures.append(future)
+        task = asyncio.create_task(self._upload(files, futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _upload(self, files: list[PageFile], futures: list[asyncio.Future[str]], /) -> None:
+        try:
+            async with self._semaphore:
+                message = await self.channel.send(files=[file.to_file() for file in files])
+            self.uploads += 1
+            self.files_uploaded += len(files)
+            if len(message.attachments) != len(files):
+                raise RuntimeError("the staging message is missing some of its attachments.")
+        except Exception as error:
+            for file, future in zip(files, futures):
+                self._pending.pop(file.key, None)
+                if not future.done():
+                    future.set_exception(error)
+            return
+        except asyncio.CancelledError:
+            for file, future in zip(files, futures):
+                self._pending.pop(file.key, None)
+                future.cancel()
+            raise
+        # attachments are returned in the order that they were uploaded in
+        for file, future, attachment in zip(files, futures, message.attachments):
+            self.cache.set(file.key, attachment.url)
+            self._pending.pop(file.key, None)
+            if not future.done():
+                future.set_result(attachment.url)
@@ -0,0 +1,130 @@
+import abc
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+__all__ = [
+    "CacheStats",
+    "BaseCache",
+    "RenderCache",
+]
+
+
+class CacheStats:
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __repr__(self) -> str:
+        return f"<CacheStats hits={self.hits} misses={self.misses} evictions={self.evictions}>"
+
+
+class BaseCache(abc.ABC):
+
+    def __init__(self) -> None:
+        self.stats: CacheStats = CacheStats()
+
+    @abc.abstractmethod
+    def __contains__(self, key: Hashable, /) -> bool:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get(self, key: Hashable, /) -> Any | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, key: Hashable, value: Any, /) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, key: Hashable, /) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class RenderCache(BaseCache):
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        size_of: Callable[[Any], int] = sys.getsizeof,
+    ) -> None:
+        super().__init__()
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("'max_entries' must be greater than 0.")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("'max_bytes' must be greater than 0.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("'ttl' must be greater than 0.")
+        self.max_entries: int | None = max_entries
+        self.max_bytes: int | None = max_bytes
+        self.ttl: float | None = ttl
+        self.size_of: Callable[[Any], int] = size_of
+        self.bytes: int = 0
+        # key -> (value, size, expiry), ordered from least to most recently used.
+        self._entries: OrderedDict[Hashable, tuple[Any, int, float | None]] = OrderedDict()
+
+    def __contains__(self, key: Hashable, /) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and (entry[2] is None or entry[2] > time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, /) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        value, _, expiry = entry
+        if expiry is not None and expiry <= time.monotonic():
+            self._remove(key)
+            self.stats.evictions += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, /) -> None:
+        if key in self._entries:
+            self._remove(key)
+        size = self.size_of(value)
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (value, size, expiry)
+        self.bytes += size
+        # evict least recently used entries until we're back within budget, this can
+        # evict the new entry itself if it is larger than 'max_bytes' on its own.
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def delete(self, key: Hashable, /) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def _remove(self, key: Hashable, /) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
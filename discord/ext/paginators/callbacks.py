@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import discord
+
 if TYPE_CHECKING:
     from .paginators import BasePaginator
 
@@ -15,8 +17,9 @@ __all__ = [
 
 
 async def disable_view(paginator: BasePaginator) -> None:
-    for item in paginator.view.items.values():
-        item.disabled = True
+    for item in paginator.view.children:
+        if isinstance(item, (discord.ui.Button, discord.ui.Select)):
+            item.disabled = True
     assert paginator.message is not None
     await paginator.message.edit(view=paginator.view)
 
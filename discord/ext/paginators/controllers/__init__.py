@@ -1,3 +1,7 @@
+from .adaptive import *
 from .base import *
 from .buttons import *
 from .default import *
+from .modals import *
+from .search import *
+from .selects import *
@@ -0,0 +1,73 @@
+from collections.abc import Hashable
+from typing import Any
+
+import discord
+
+from .buttons import SkipPagesButton
+from .default import DefaultController
+from .selects import PageRangeSelect
+from ..types import PaginatorT
+
+
+__all__ = ["AdaptiveController"]
+
+
+class AdaptiveController(DefaultController[PaginatorT]):
+
+    # page counts above which each control is added
+    SKIP_10_THRESHOLD: int = 20
+    SKIP_100_THRESHOLD: int = 200
+    RANGES_THRESHOLD: int = 10
+
+    def __init__(self, paginator: PaginatorT) -> None:
+        super().__init__(paginator)
+        self.ranges: PageRangeSelect[Any] | None = None
+        if (range_size := self._range_size()) is not None:
+            self.ranges = PageRangeSelect(range_size=range_size)
+            if self.paginator.persistence is not None:
+                self.ranges.custom_id = self.paginator.persistence.custom_id("ranges")
+            self.add_item(self.ranges)
+
+    def layout(self) -> Hashable:
+        pages = self.paginator.pages
+        return (
+            super().layout(),
+            pages.complete and len(pages) > self.SKIP_10_THRESHOLD,
+            pages.complete and len(pages) > self.SKIP_100_THRESHOLD,
+            self._range_size(),
+        )
+
+    def _range_size(self) -> int | None:
+        pages = self.paginator.pages
+        if not pages.complete or len(pages) <= self.RANGES_THRESHOLD:
+            return None
+        # single pages while they all fit in one select, ranges of 10 in a window after that
+        return 1 if len(pages) <= 25 else 10
+
+    def create_items(self) -> dict[str, discord.ui.Button[Any]]:
+        items = super().create_items()
+        pages = self.paginator.pages
+        if not pages.complete or len(pages) <= self.SKIP_10_THRESHOLD:
+            return items
+        # skips go on the second row, in front of the stop button
+        stop = items.pop("stop")
+        if len(pages) > self.SKIP_100_THRESHOLD:
+            items["back_100"] = SkipPagesButton(-100)
+        items["back_10"] = SkipPagesButton(-10)
+        items["forward_10"] = SkipPagesButton(10)
+        if len(pages) > self.SKIP_100_THRESHOLD:
+            items["forward_100"] = SkipPagesButton(100)
+        items["stop"] = stop
+        return items
+
+    def update_item_states(self) -> None:
+        super().update_item_states()
+        page, total = self.paginator.page, len(self.paginator.pages)
+        for name in ("back_100", "back_10"):
+            if name in self.items:
+                self.items[name].disabled = page <= 1
+        for name in ("forward_10", "forward_100"):
+            if name in self.items:
+                self.items[name].disabled = page >= total
+        if self.ranges is not None:
+            self.ranges.update_options(page, total)
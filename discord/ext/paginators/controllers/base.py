@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Hashable
 from typing import Generic
 
 import discord
@@ -12,11 +13,26 @@ __all__ = ["BaseController"]
 class BaseController(discord.ui.View, abc.ABC, Generic[PaginatorT]):
 
     def __init__(self, paginator: PaginatorT) -> None:
-        super().__init__(timeout=paginator.timeout)
+        # the registry runs a single scheduler for the timeouts of all paginators it tracks.
+        # shared controllers keep their own, discord.py gives views sent with ephemeral
+        # messages a 15 minute timeout otherwise.
+        super().__init__(timeout=paginator.timeout if paginator.registry is None or paginator.shared else None)
         self.paginator: PaginatorT = paginator
+        self.created_layout: Hashable = self.layout()
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        return self.paginator.ctx.author.id == interaction.user.id
+        if not self.paginator.shared and self.paginator.author_id != interaction.user.id:
+            if self.paginator.metrics is not None:
+                self.paginator.metrics.increment("rejected_interactions", paginator=self.paginator)
+            return False
+        if self.paginator.registry is not None:
+            self.paginator.registry.refresh(self.paginator)
+        return True
+
+    def layout(self) -> Hashable:
+        # controllers whose items depend on the pages return something that changes along
+        # with them, so that paginators know to create a new controller when pages are added.
+        return None
 
     async def on_timeout(self) -> None:
         await self.paginator.stop(callback=self.paginator.on_timeout)
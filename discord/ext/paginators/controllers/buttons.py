@@ -1,5 +1,9 @@
+import time
+from typing import Any
+
 import discord
 
+from .modals import JumpToPageModal, SearchModal
 from ..types import ControllerT
 
 
@@ -10,30 +14,38 @@ __all__ = [
     "NextPageButton",
     "LastPageButton",
     "StopButton",
+    "SkipPagesButton",
+    "JumpToPageButton",
+    "SearchButton",
 ]
 
 
 class BaseButton(discord.ui.Button[ControllerT]):
 
     async def callback(self, interaction: discord.Interaction) -> None:
+        assert self.view is not None
+        if (metrics := self.view.paginator.metrics) is None:
+            # noinspection PyUnresolvedReferences
+            await interaction.response.defer()
+            return
+        deferred = time.perf_counter()
         # noinspection PyUnresolvedReferences
         await interaction.response.defer()
+        metrics.observe("defer", time.perf_counter() - deferred, paginator=self.view.paginator)
 
 
 class FirstPageButton(BaseButton[ControllerT]):
 
     async def callback(self, interaction: discord.Interaction) -> None:
-        await super().callback(interaction)
         assert self.view is not None
-        await self.view.paginator.go_to_first_page()
+        await self.view.paginator.go_to_first_page(interaction=interaction)
 
 
 class PreviousPageButton(BaseButton[ControllerT]):
 
     async def callback(self, interaction: discord.Interaction) -> None:
-        await super().callback(interaction)
         assert self.view is not None
-        await self.view.paginator.go_to_previous_page()
+        await self.view.paginator.go_to_previous_page(interaction=interaction)
 
 
 class LabelButton(BaseButton[ControllerT]):
@@ -43,22 +55,55 @@ class LabelButton(BaseButton[ControllerT]):
 class NextPageButton(BaseButton[ControllerT]):
 
     async def callback(self, interaction: discord.Interaction) -> None:
-        await super().callback(interaction)
         assert self.view is not None
-        await self.view.paginator.go_to_next_page()
+        await self.view.paginator.go_to_next_page(interaction=interaction)
 
 
 class LastPageButton(BaseButton[ControllerT]):
 
     async def callback(self, interaction: discord.Interaction) -> None:
-        await super().callback(interaction)
         assert self.view is not None
-        await self.view.paginator.go_to_last_page()
+        await self.view.paginator.go_to_last_page(interaction=interaction)
 
 
 class StopButton(BaseButton[ControllerT]):
 
     async def callback(self, interaction: discord.Interaction) -> None:
+        assert self.view is not None
+        paginator = self.view.paginator
+        # only the author can stop a shared paginator, everyone else closes their own cursor
+        if paginator.shared and interaction.user.id != paginator.author_id:
+            await paginator.close_cursor(interaction)
+            return
         await super().callback(interaction)
+        await paginator.stop(callback=paginator.on_stop_button_press)
+
+
+class SkipPagesButton(BaseButton[ControllerT]):
+
+    def __init__(self, offset: int, /, **kwargs: Any) -> None:
+        super().__init__(label=f"{offset:+}", **kwargs)
+        self.offset: int = offset
+
+    async def callback(self, interaction: discord.Interaction) -> None:
         assert self.view is not None
-        await self.view.paginator.stop(callback=self.view.paginator.on_stop_button_press)
+        paginator = self.view.paginator
+        # skips past either end land on the first or last page
+        page = min(max(paginator.page_for(interaction) + self.offset, 1), len(paginator.pages))
+        await paginator.change_page(page, interaction=interaction)
+
+
+class JumpToPageButton(BaseButton[ControllerT]):
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        assert self.view is not None
+        # noinspection PyUnresolvedReferences
+        await interaction.response.send_modal(JumpToPageModal(self.view.paginator))
+
+
+class SearchButton(BaseButton[ControllerT]):
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        assert self.view is not None
+        # noinspection PyUnresolvedReferences
+        await interaction.response.send_modal(SearchModal(self.view.paginator))
@@ -1,3 +1,8 @@
+from collections.abc import Hashable
+from typing import Any
+
+import discord
+
 from .base import BaseController
 from .buttons import FirstPageButton, LabelButton, LastPageButton, NextPageButton, PreviousPageButton, StopButton
 from ..types import PaginatorT
@@ -6,39 +11,66 @@ from ..types import PaginatorT
 __all__ = ["DefaultController"]
 
 
+# emojis are parsed once and shared by the buttons of every controller
+_FIRST = discord.PartialEmoji(name="\N{BLACK LEFT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}")
+_PREVIOUS = discord.PartialEmoji(name="\N{BLACK LEFT-POINTING TRIANGLE}")
+_NEXT = discord.PartialEmoji(name="\N{BLACK RIGHT-POINTING TRIANGLE}")
+_LAST = discord.PartialEmoji(name="\N{BLACK RIGHT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}")
+_STOP = discord.PartialEmoji(name="\N{BLACK SQUARE FOR STOP}")
+
+
 class DefaultController(BaseController[PaginatorT]):
 
     def __init__(self, paginator: PaginatorT) -> None:
         super().__init__(paginator)
-        if len(self.paginator.pages) == 1:
-            self.items = {
+        self.items: dict[str, discord.ui.Button[Any]] = {}
+        self.add_items(self.create_items())
+
+    def create_items(self) -> dict[str, discord.ui.Button[Any]]:
+        pages = self.paginator.pages
+        items: dict[str, discord.ui.Button[Any]]
+        if pages.complete and len(pages) == 1:
+            items = {
                 "label": LabelButton(label="?"),
-                "stop":  StopButton(emoji="\N{BLACK SQUARE FOR STOP}")
+                "stop":  StopButton(emoji=_STOP)
             }
-        elif len(self.paginator.pages) == 2:
-            self.items = {
-                "previous": PreviousPageButton(emoji="\N{BLACK LEFT-POINTING TRIANGLE}"),
+        elif pages.complete and len(pages) == 2:
+            items = {
+                "previous": PreviousPageButton(emoji=_PREVIOUS),
                 "label":    LabelButton(label="?"),
-                "next":     NextPageButton(emoji="\N{BLACK RIGHT-POINTING TRIANGLE}"),
-                "stop":     StopButton(emoji="\N{BLACK SQUARE FOR STOP}")
+                "next":     NextPageButton(emoji=_NEXT),
+                "stop":     StopButton(emoji=_STOP)
             }
         else:
-            self.items = {
-                "first":    FirstPageButton(emoji="\N{BLACK LEFT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}"),
-                "previous": PreviousPageButton(emoji="\N{BLACK LEFT-POINTING TRIANGLE}"),
+            items = {
+                "first":    FirstPageButton(emoji=_FIRST),
+                "previous": PreviousPageButton(emoji=_PREVIOUS),
                 "label":    LabelButton(label="?"),
-                "next":     NextPageButton(emoji="\N{BLACK RIGHT-POINTING TRIANGLE}"),
-                "last":     LastPageButton(emoji="\N{BLACK RIGHT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}"),
-                "stop":     StopButton(emoji="\N{BLACK SQUARE FOR STOP}")
+                "next":     NextPageButton(emoji=_NEXT),
+                "last":     LastPageButton(emoji=_LAST),
+                "stop":     StopButton(emoji=_STOP)
             }
-        for item in self.items.values():
+        return items
+
+    def layout(self) -> Hashable:
+        pages = self.paginator.pages
+        return len(pages) if pages.complete and len(pages) <= 2 else None
+
+    def add_items(self, items: dict[str, discord.ui.Button[Any]]) -> None:
+        for name, item in items.items():
+            # persistent paginators need stable custom ids to be picked up again after a restart
+            if self.paginator.persistence is not None:
+                item.custom_id = self.paginator.persistence.custom_id(name)
+            self.items[name] = item
             self.add_item(item)
 
     def update_item_states(self) -> None:
-        self.items["label"].label = f"{self.paginator.page}/{len(self.paginator.pages)}"
+        pages = self.paginator.pages
+        # the total amount of pages is unknown until streamed pages have been fully loaded
+        self.items["label"].label = f"{self.paginator.page}/{len(pages) if pages.complete else '?'}"
         if "first" in self.items:
             self.items["first"].disabled = self.paginator.page <= 2
-            self.items["last"].disabled = self.paginator.page >= len(self.paginator.pages) - 1
+            self.items["last"].disabled = pages.complete and self.paginator.page >= len(pages) - 1
         if "previous" in self.items:
             self.items["previous"].disabled = self.paginator.page <= 1
-            self.items["next"].disabled = self.paginator.page >= len(self.paginator.pages)
+            self.items["next"].disabled = pages.complete and self.paginator.page >= len(pages)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import discord
+
+if TYPE_CHECKING:
+    from ..paginators import BasePaginator
+
+
+__all__ = [
+    "JumpToPageModal",
+    "SearchModal",
+]
+
+
+class JumpToPageModal(discord.ui.Modal, title="Go to page"):
+
+    def __init__(self, paginator: BasePaginator[Any, Any]) -> None:
+        super().__init__()
+        self.paginator: BasePaginator[Any, Any] = paginator
+        pages = paginator.pages
+        self.page: discord.ui.TextInput[JumpToPageModal] = discord.ui.TextInput(
+            label="Page",
+            placeholder=f"1-{len(pages) if pages.complete else '?'}",
+            max_length=10,
+        )
+        self.add_item(self.page)
+
+    async def on_submit(self, interaction: discord.Interaction) -> None:
+        page = int(self.page.value) if self.page.value.isdigit() else 0
+        # sources may have to fetch every page up to the one asked for, which change_page
+        # defers the interaction for if it takes too long.
+        try:
+            await self.paginator.change_page(page, interaction=interaction)
+        except ValueError:
+            await self.paginator.notify(interaction, f"'{self.page.value}' is not a valid page.")
+
+
+class SearchModal(discord.ui.Modal, title="Search"):
+
+    def __init__(self, paginator: BasePaginator[Any, Any]) -> None:
+        super().__init__()
+        self.paginator: BasePaginator[Any, Any] = paginator
+        self.term: discord.ui.TextInput[SearchModal] = discord.ui.TextInput(
+            label="Search for",
+            max_length=100,
+        )
+        self.add_item(self.term)
+
+    async def on_submit(self, interaction: discord.Interaction) -> None:
+        page = await self.paginator.search(self.term.value, interaction=interaction)
+        if page is None:
+            await self.paginator.notify(interaction, f"No pages contain '{self.term.value}'.")
+            return
+        await self.paginator.change_page(page, interaction=interaction)
@@ -0,0 +1,27 @@
+import discord
+
+from .buttons import JumpToPageButton, SearchButton
+from .default import DefaultController
+from ..types import PaginatorT
+
+
+__all__ = ["SearchController"]
+
+
+_JUMP = discord.PartialEmoji(name="\N{INPUT SYMBOL FOR NUMBERS}")
+_SEARCH = discord.PartialEmoji(name="\N{LEFT-POINTING MAGNIFYING GLASS}")
+
+
+class SearchController(DefaultController[PaginatorT]):
+
+    def __init__(self, paginator: PaginatorT) -> None:
+        super().__init__(paginator)
+        pages = self.paginator.pages
+        if pages.complete and len(pages) == 1:
+            return
+        self.add_items(
+            {
+                "jump":   JumpToPageButton(emoji=_JUMP),
+                "search": SearchButton(emoji=_SEARCH),
+            }
+        )
@@ -0,0 +1,55 @@
+from typing import Any
+
+import discord
+
+from ..types import ControllerT
+
+
+__all__ = ["PageRangeSelect"]
+
+
+class PageRangeSelect(discord.ui.Select[ControllerT]):
+
+    def __init__(self, *, range_size: int, max_options: int = 25, **kwargs: Any) -> None:
+        if range_size <= 0:
+            raise ValueError("'range_size' must be greater than 0.")
+        if not 0 < max_options <= 25:
+            raise ValueError("'max_options' must be between 1 and 25 (inclusive).")
+        super().__init__(placeholder="Go to page...", **kwargs)
+        self.range_size: int = range_size
+        self.max_options: int = max_options
+        # range index -> option, for the ranges currently in the window
+        self._options: dict[int, discord.SelectOption] = {}
+        self._window: tuple[int, int, int] = (0, 0, 0)
+        self._selected: int | None = None
+
+    def update_options(self, page: int, total: int, /) -> None:
+        ranges = -(-total // self.range_size)
+        current = (page - 1) // self.range_size
+        # keep the window of ranges centered on the current page where possible
+        start = min(max(current - self.max_options // 2, 0), max(ranges - self.max_options, 0))
+        stop = min(start + self.max_options, ranges)
+        if self._selected is not None and self._selected != current:
+            if (previous := self._options.get(self._selected)) is not None:
+                previous.default = False
+        if (start, stop, total) != self._window:
+            # options that are still in the window are reused, only new ones are created
+            if total != self._window[2]:
+                self._options.clear()
+            self._options = {
+                index: self._options.get(index) or self._create_option(index, total)
+                for index in range(start, stop)
+            }
+            self._window = (start, stop, total)
+            self.options = list(self._options.values())
+        self._options[current].default = True
+        self._selected = current
+
+    def _create_option(self, index: int, total: int, /) -> discord.SelectOption:
+        first = index * self.range_size + 1
+        last = min(first + self.range_size - 1, total)
+        return discord.SelectOption(label=f"Page {first}" if first == last else f"Pages {first}-{last}", value=str(first))
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        assert self.view is not None
+        await self.view.paginator.change_page(int(self.values[0]), interaction=interaction)
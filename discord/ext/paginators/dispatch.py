@@ -0,0 +1,110 @@
+import asyncio
+import itertools
+from collections import OrderedDict
+from typing import Any
+
+import discord
+
+
+__all__ = [
+    "EditDispatcher",
+    "default_dispatcher",
+]
+
+
+class _PendingEdit:
+
+    __slots__ = (
+        "message",
+        "payload",
+        "futures",
+    )
+
+    def __init__(self, message: discord.Message, payload: dict[str, Any], /) -> None:
+        self.message: discord.Message = message
+        self.payload: dict[str, Any] = payload
+        self.futures: list[asyncio.Future[None]] = []
+
+
+class EditDispatcher:
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("'max_retries' must be greater than or equal to 0.")
+        if backoff <= 0:
+            raise ValueError("'backoff' must be greater than 0.")
+        self.max_retries: int = max_retries
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        # channel id -> message id -> pending edit, in the order the messages were queued.
+        # each channel is worked through one edit at a time, since edits in a channel share
+        # a rate limit bucket.
+        self._channels: dict[int, OrderedDict[int, _PendingEdit]] = {}
+        self._workers: dict[int, asyncio.Task[None]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(edits) for edits in self._channels.values())
+
+    async def edit(self, message: discord.Message, /, **payload: Any) -> None:
+        edits = self._channels.setdefault(message.channel.id, OrderedDict())
+        # a newer edit for a message that is still queued replaces it in place, so the older
+        # one is never sent and both callers are resolved by the newer one.
+        if (edit := edits.get(message.id)) is not None:
+            edit.payload.update(payload)
+        else:
+            edit = edits[message.id] = _PendingEdit(message, payload)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        edit.futures.append(future)
+        if (worker := self._workers.get(message.channel.id)) is None or worker.done():
+            self._workers[message.channel.id] = asyncio.create_task(self._run_channel(message.channel.id))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # drop the edit if nobody is waiting for it anymore and it hasn't been sent yet
+            edit.futures.remove(future)
+            if not edit.futures and edits.get(message.id) is edit:
+                del edits[message.id]
+            raise
+
+    async def _run_channel(self, channel_id: int, /) -> None:
+        edits = self._channels[channel_id]
+        while edits:
+            # messages take turns, an edit queued while its message is being edited goes to
+            # the back of the queue behind the other messages.
+            _, edit = edits.popitem(last=False)
+            try:
+                await self._send(edit)
+            except Exception as error:
+                for future in edit.futures:
+                    if not future.done():
+                        future.set_exception(error)
+            else:
+                for future in edit.futures:
+                    if not future.done():
+                        future.set_result(None)
+        del self._channels[channel_id]
+        del self._workers[channel_id]
+
+    async def _send(self, edit: _PendingEdit, /) -> None:
+        for attempt in itertools.count():
+            try:
+                await edit.message.edit(**edit.payload)
+                return
+            except discord.RateLimited as error:
+                if attempt >= self.max_retries:
+                    raise
+                delay = error.retry_after
+            except discord.HTTPException as error:
+                if error.status != 429 or attempt >= self.max_retries:
+                    raise
+                delay = self.backoff * 2 ** attempt
+            await asyncio.sleep(min(delay, self.max_backoff))
+
+
+default_dispatcher: EditDispatcher = EditDispatcher()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from .paginators import BasePaginator
+
+
+__all__ = [
+    "MetricsSink",
+    "MetricSummary",
+    "InMemoryMetrics",
+]
+
+
+class MetricsSink(Protocol):
+
+    def observe(self, name: str, value: float, /, *, paginator: BasePaginator[Any, Any]) -> None:
+        ...
+
+    def increment(self, name: str, /, *, paginator: BasePaginator[Any, Any]) -> None:
+        ...
+
+
+class MetricSummary:
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.minimum: float = float("inf")
+        self.maximum: float = float("-inf")
+
+    def __repr__(self) -> str:
+        return f"<MetricSummary count={self.count} mean={self.mean} minimum={self.minimum} maximum={self.maximum}>"
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, value: float, /) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+
+class InMemoryMetrics:
+
+    def __init__(self) -> None:
+        self.observations: dict[str, MetricSummary] = {}
+        self.counters: dict[str, int] = {}
+
+    def observe(self, name: str, value: float, /, *, paginator: BasePaginator[Any, Any]) -> None:
+        if (summary := self.observations.get(name)) is None:
+            summary = self.observations[name] = MetricSummary()
+        summary.add(value)
+
+    def increment(self, name: str, /, *, paginator: BasePaginator[Any, Any]) -> None:
+        self.counters[name] = self.counters.get(name, 0) + 1
@@ -0,0 +1,728 @@
+import abc
+import asyncio
+import bisect
+import inspect
+import itertools
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Hashable, Iterable, Iterator, Sequence
+from typing import Any, overload
+
+from .caches import BaseCache, RenderCache
+from .renderers import PageRenderer
+
+
+__all__ = [
+    "AsyncPageSource",
+    "OffsetPageSource",
+    "BasePages",
+    "EagerPages",
+    "LazyPages",
+    "StreamPages",
+    "SourcePages",
+    "PageSetCache",
+    "build_pages",
+    "pack_items",
+    "split_item",
+]
+
+
+_MISSING: Any = object()
+
+
+# sources
+
+class AsyncPageSource(abc.ABC):
+
+    @abc.abstractmethod
+    async def fetch(self, cursor: Any, limit: int, /) -> tuple[Sequence[Any], Any]:
+        raise NotImplementedError
+
+    async def count(self) -> int | None:
+        return None
+
+
+class OffsetPageSource(AsyncPageSource):
+
+    @abc.abstractmethod
+    async def fetch_range(self, offset: int, limit: int, /) -> Sequence[Any]:
+        raise NotImplementedError
+
+    async def fetch(self, cursor: Any, limit: int, /) -> tuple[Sequence[Any], Any]:
+        offset = cursor or 0
+        items = await self.fetch_range(offset, limit)
+        return items, offset + len(items) if len(items) == limit else None
+
+
+# pages
+
+class BasePages(Sequence[Any], abc.ABC):
+
+    __slots__ = (
+        "items_per_page",
+        "join_items",
+        "join_items_with",
+        "max_built_pages",
+        "max_page_length",
+        "_built",
+    )
+
+    def __init__(
+        self,
+        *,
+        items_per_page: int,
+        join_items: bool = True,
+        join_items_with: str = "\n",
+        max_built_pages: int = 10,
+        max_page_length: int | None = None,
+    ) -> None:
+        if items_per_page <= 0:
+            raise ValueError("'items_per_page' must be greater than 0.")
+        if max_built_pages <= 0:
+            raise ValueError("'max_built_pages' must be greater than 0.")
+        if max_page_length is not None:
+            if max_page_length <= 0:
+                raise ValueError("'max_page_length' must be greater than 0.")
+            if join_items is False:
+                raise ValueError("'max_page_length' can only be used when items are joined.")
+        self.items_per_page: int = items_per_page
+        self.join_items: bool = join_items
+        self.join_items_with: str = join_items_with
+        self.max_built_pages: int = max_built_pages
+        self.max_page_length: int | None = max_page_length
+        self._built: OrderedDict[int, Any] = OrderedDict()
+
+    # sequence methods
+
+    @overload
+    def __getitem__(self, index: int, /) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice, /) -> Sequence[Any]:
+        ...
+
+    def __getitem__(self, index: int | slice, /) -> Any:
+        if isinstance(index, slice):
+            return [self._get_page(x) for x in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("page index out of range")
+        return self._get_page(index)
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    # page methods
+
+    @property
+    def complete(self) -> bool:
+        return True
+
+    async def load(self, page: int, /) -> bool:
+        return 1 <= page <= len(self)
+
+    async def load_all(self) -> None:
+        return
+
+    def extend(self, items: Sequence[Any], /) -> int:
+        # returns the number of the first page that was changed or added
+        raise TypeError(f"'{type(self).__name__}' can not be extended.")
+
+    def unbuilt_items(self, index: int, /) -> Sequence[Any] | None:
+        # the items of a page that hasn't been built yet, so that it can be built somewhere
+        # else (e.g. by a renderer). None if the page is already built or only exists built.
+        return None
+
+    def _build_page(self, items: Sequence[Any]) -> Any:
+        return self.join_items_with.join(items) if self.join_items else items
+
+    def _get_built_page(self, index: int, /) -> Any:
+        page = self._built.get(index, _MISSING)
+        if page is not _MISSING:
+            self._built.move_to_end(index)
+        return page
+
+    def _set_built_page(self, index: int, page: Any, /) -> Any:
+        self._built[index] = page
+        if len(self._built) > self.max_built_pages:
+            self._built.popitem(last=False)
+        return page
+
+    @abc.abstractmethod
+    def _get_page(self, index: int, /) -> Any:
+        raise NotImplementedError
+
+
+class EagerPages(BasePages):
+
+    __slots__ = (
+        "_pages",
+        "_last_count",
+    )
+
+    def __init__(
+        self,
+        items: Sequence[Any],
+        *,
+        items_per_page: int,
+        join_items: bool = True,
+        join_items_with: str = "\n",
+        max_page_length: int | None = None,
+    ) -> None:
+        super().__init__(
+            items_per_page=items_per_page,
+            join_items=join_items,
+            join_items_with=join_items_with,
+            max_page_length=max_page_length,
+        )
+        # the amount of items on the last page is tracked so that it can be filled up by 'extend'
+        if max_page_length is None:
+            self._pages: list[Any] = [
+                self._build_page(items[x:x + items_per_page])
+                for x in range(0, len(items), items_per_page)
+            ]
+            self._last_count: int = (len(items) - 1) % items_per_page + 1 if items else 0
+        else:
+            items = _split_items(items, max_page_length)
+            bounds = pack_items(
+                items,
+                items_per_page=items_per_page,
+                max_page_length=max_page_length,
+                join_items_with=join_items_with,
+            )
+            self._pages = [self._build_page(items[start:end]) for start, end in itertools.pairwise(bounds)]
+            self._last_count = bounds[-1] - bounds[-2] if len(bounds) > 1 else 0
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def _get_page(self, index: int, /) -> Any:
+        return self._pages[index]
+
+    def extend(self, items: Sequence[Any], /) -> int:
+        if self.max_page_length is not None:
+            items = _split_items(items, self.max_page_length)
+        # fill up the last page first, then add new pages for the rest of the items
+        room = 0
+        if self._pages and self.max_page_length is None:
+            room = min(self.items_per_page - self._last_count, len(items))
+        elif self._pages and self.max_page_length is not None:
+            step, length = len(self.join_items_with), len(self._pages[-1])
+            while (
+                room < len(items)
+                and self._last_count + room < self.items_per_page
+                and length + step + len(items[room]) <= self.max_page_length
+            ):
+                length += step + len(items[room])
+                room += 1
+        first = len(self._pages) if room else len(self._pages) + 1
+        if room:
+            if self.join_items:
+                self._pages[-1] = f"{self._pages[-1]}{self.join_items_with}{self._build_page(items[:room])}"
+            else:
+                self._pages[-1] = [*self._pages[-1], *items[:room]]
+            self._last_count += room
+        items = items[room:]
+        if not items:
+            return first
+        if self.max_page_length is None:
+            bounds = [*range(0, len(items), self.items_per_page), len(items)]
+        else:
+            bounds = pack_items(
+                items,
+                items_per_page=self.items_per_page,
+                max_page_length=self.max_page_length,
+                join_items_with=self.join_items_with,
+            )
+        self._pages.extend(self._build_page(items[start:end]) for start, end in itertools.pairwise(bounds))
+        self._last_count = bounds[-1] - bounds[-2]
+        return first
+
+
+class LazyPages(BasePages):
+
+    __slots__ = (
+        "_bounds",
+        "_items",
+        "_owned",
+    )
+
+    def __init__(
+        self,
+        items: Sequence[Any],
+        *,
+        items_per_page: int,
+        join_items: bool = True,
+        join_items_with: str = "\n",
+        max_built_pages: int = 10,
+        max_page_length: int | None = None,
+    ) -> None:
+        super().__init__(
+            items_per_page=items_per_page,
+            join_items=join_items,
+            join_items_with=join_items_with,
+            max_built_pages=max_built_pages,
+            max_page_length=max_page_length,
+        )
+        # packed pages have irregular sizes, so their boundaries are computed up front,
+        # which only needs the length of each item and not the pages themselves.
+        self._bounds: list[int] | None = None
+        if max_page_length is not None:
+            items = _split_items(items, max_page_length)
+            self._bounds = pack_items(
+                items,
+                items_per_page=items_per_page,
+                max_page_length=max_page_length,
+                join_items_with=join_items_with,
+            )
+        self._items: Sequence[Any] = items
+        self._owned: bool = False
+
+    def __len__(self) -> int:
+        if self._bounds is not None:
+            return len(self._bounds) - 1
+        return -(-len(self._items) // self.items_per_page)
+
+    def extend(self, items: Sequence[Any], /) -> int:
+        if self.max_page_length is not None:
+            items = _split_items(items, self.max_page_length)
+        # the items are copied the first time so that the callers sequence isn't modified
+        if not self._owned:
+            self._items = list(self._items)
+            self._owned = True
+        assert isinstance(self._items, list)
+        if self._bounds is None:
+            first = len(self._items) // self.items_per_page + 1
+            self._items.extend(items)
+        else:
+            assert self.max_page_length is not None
+            # only the last page and the new items need packing again
+            start = self._bounds[-2] if len(self._bounds) > 1 else 0
+            first = max(len(self._bounds) - 1, 1)
+            self._items.extend(items)
+            tail = pack_items(
+                self._items[start:],
+                items_per_page=self.items_per_page,
+                max_page_length=self.max_page_length,
+                join_items_with=self.join_items_with,
+            )
+            del self._bounds[max(len(self._bounds) - 2, 0):]
+            self._bounds.extend(start + bound for bound in tail)
+        # drop built copies of the pages that changed
+        for index in [index for index in self._built if index >= first - 1]:
+            del self._built[index]
+        return first
+
+    def unbuilt_items(self, index: int, /) -> Sequence[Any] | None:
+        if self._get_built_page(index) is not _MISSING:
+            return None
+        return self._get_items(index)
+
+    def _get_items(self, index: int, /) -> Sequence[Any]:
+        if self._bounds is not None:
+            start, end = self._bounds[index], self._bounds[index + 1]
+        else:
+            start = index * self.items_per_page
+            end = start + self.items_per_page
+        return self._items[start:end]
+
+    def _get_page(self, index: int, /) -> Any:
+        page = self._get_built_page(index)
+        if page is _MISSING:
+            page = self._set_built_page(index, self._build_page(self._get_items(index)))
+        return page
+
+
+class StreamPages(BasePages):
+
+    __slots__ = (
+        "_iterator",
+        "_async_iterator",
+        "_chunks",
+        "_pending",
+        "_complete",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        items: Iterable[Any] | AsyncIterable[Any],
+        *,
+        items_per_page: int,
+        join_items: bool = True,
+        join_items_with: str = "\n",
+        max_built_pages: int = 10,
+        max_page_length: int | None = None,
+    ) -> None:
+        super().__init__(
+            items_per_page=items_per_page,
+            join_items=join_items,
+            join_items_with=join_items_with,
+            max_built_pages=max_built_pages,
+            max_page_length=max_page_length,
+        )
+        self._iterator: Iterator[Any] | None = None
+        self._async_iterator: AsyncIterator[Any] | None = None
+        if isinstance(items, AsyncIterable):
+            self._async_iterator = aiter(items)
+        else:
+            self._iterator = iter(items)
+        # raw chunks have to be kept around as the source can not be rewound, only
+        # their built (joined) form is limited to the window of recently used pages.
+        self._chunks: list[list[Any]] = []
+        self._pending: deque[Any] = deque()
+        self._complete: bool = False
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def unbuilt_items(self, index: int, /) -> Sequence[Any] | None:
+        if self._get_built_page(index) is not _MISSING:
+            return None
+        return self._chunks[index]
+
+    def _get_page(self, index: int, /) -> Any:
+        page = self._get_built_page(index)
+        if page is _MISSING:
+            page = self._set_built_page(index, self._build_page(self._chunks[index]))
+        return page
+
+    @property
+    def complete(self) -> bool:
+        return self._complete
+
+    async def load(self, page: int, /) -> bool:
+        if page <= 0:
+            return False
+        async with self._lock:
+            while len(self._chunks) < page and self._complete is False:
+                chunk = await self._next_chunk()
+                if chunk:
+                    self._chunks.append(chunk)
+        return page <= len(self._chunks)
+
+    async def load_all(self) -> None:
+        while self._complete is False:
+            await self.load(len(self._chunks) + 1)
+
+    async def _next_item(self) -> Any:
+        if self._pending:
+            return self._pending.popleft()
+        if self._async_iterator is not None:
+            item = await anext(self._async_iterator, _MISSING)
+        else:
+            assert self._iterator is not None
+            item = next(self._iterator, _MISSING)
+        if item is not _MISSING and self.max_page_length is not None and len(item) > self.max_page_length:
+            item, *parts = split_item(item, self.max_page_length)
+            self._pending.extend(parts)
+        return item
+
+    async def _next_chunk(self) -> list[Any]:
+        chunk: list[Any] = []
+        length = -len(self.join_items_with)
+        while len(chunk) < self.items_per_page:
+            item = await self._next_item()
+            if item is _MISSING:
+                self._complete = True
+                return chunk
+            if self.max_page_length is not None:
+                length += len(self.join_items_with) + len(item)
+                if chunk and length > self.max_page_length:
+                    self._pending.appendleft(item)
+                    return chunk
+            chunk.append(item)
+        # look one item ahead so that the end of the source is known as soon as the
+        # last page has been loaded, rather than one page later.
+        item = await self._next_item()
+        if item is _MISSING:
+            self._complete = True
+        else:
+            self._pending.appendleft(item)
+        return chunk
+
+
+class SourcePages(BasePages):
+
+    __slots__ = (
+        "source",
+        "_cursors",
+        "_known",
+        "_limit",
+        "_total",
+        "_count_task",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        source: AsyncPageSource,
+        *,
+        items_per_page: int,
+        join_items: bool = True,
+        join_items_with: str = "\n",
+        max_built_pages: int = 10,
+    ) -> None:
+        super().__init__(
+            items_per_page=items_per_page,
+            join_items=join_items,
+            join_items_with=join_items_with,
+            max_built_pages=max_built_pages,
+        )
+        self.source: AsyncPageSource = source
+        # the cursor that each page starts at, as far as pages have been walked so far.
+        self._cursors: list[Any] = [None]
+        # pages 1 to '_known' are known to exist, pages after '_limit' are known not to.
+        self._known: int = 0
+        self._limit: int | None = None
+        self._total: int | None = None
+        self._count_task: asyncio.Task[None] | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return self._total if self._total is not None else self._known
+
+    def _get_page(self, index: int, /) -> Any:
+        page = self._get_built_page(index)
+        if page is _MISSING:
+            raise RuntimeError(f"Page {index + 1} has not been loaded, 'load' must be awaited before accessing it.")
+        return page
+
+    @property
+    def complete(self) -> bool:
+        return self._total is not None
+
+    async def load(self, page: int, /) -> bool:
+        if page <= 0 or (self._total is not None and page > self._total):
+            return False
+        self._start_count()
+        if self._get_built_page(page - 1) is not _MISSING:
+            return True
+        async with self._lock:
+            if isinstance(self.source, OffsetPageSource):
+                return await self._fetch(page - 1)
+            # cursor based sources have to be walked up to the requested page
+            while len(self._cursors) < page:
+                if self._total is not None:
+                    return False
+                await self._fetch(len(self._cursors) - 1)
+            return await self._fetch(page - 1)
+
+    async def load_all(self) -> None:
+        self._start_count()
+        if self._total is None and self._count_task is not None:
+            await asyncio.wait((self._count_task,))
+        async with self._lock:
+            if isinstance(self.source, OffsetPageSource):
+                # probe further and further ahead until a page is missing, then binary
+                # search for the last page between it and the last page that exists.
+                while self._total is None:
+                    if self._limit is None:
+                        await self._fetch(max(self._known, 1) * 2 - 1)
+                    else:
+                        await self._fetch((self._known + self._limit + 1) // 2 - 1)
+            else:
+                while self._total is None:
+                    await self._fetch(len(self._cursors) - 1)
+
+    def _start_count(self) -> None:
+        if self._count_task is None:
+            self._count_task = asyncio.create_task(self._count())
+            self._count_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def _count(self) -> None:
+        if (count := await self.source.count()) is not None:
+            self._total = -(-count // self.items_per_page)
+            self._known = min(self._known, self._total)
+
+    async def _fetch(self, index: int, /) -> bool:
+        if self._get_built_page(index) is not _MISSING:
+            return True
+        if isinstance(self.source, OffsetPageSource):
+            cursor = index * self.items_per_page
+        else:
+            cursor = self._cursors[index]
+        items, cursor = await self.source.fetch(cursor, self.items_per_page)
+        if not items:
+            self._limit = index if self._limit is None else min(self._limit, index)
+        else:
+            self._set_built_page(index, self._build_page(items))
+            self._known = max(self._known, index + 1)
+            if cursor is None or len(items) < self.items_per_page:
+                self._limit = index + 1
+            elif index + 1 == len(self._cursors):
+                self._cursors.append(cursor)
+        if self._total is None and self._limit is not None and self._known >= self._limit:
+            self._total = self._limit
+        return bool(items)
+
+
+def split_item(item: str, max_length: int, /) -> list[str]:
+    parts: list[str] = []
+    while len(item) > max_length:
+        # prefer splitting on a newline or space so that words stay intact.
+        index = item.rfind("\n", 0, max_length + 1)
+        if index <= 0:
+            index = item.rfind(" ", 0, max_length + 1)
+        if index <= 0:
+            parts.append(item[:max_length])
+            item = item[max_length:]
+        else:
+            parts.append(item[:index])
+            item = item[index + 1:]
+    parts.append(item)
+    return parts
+
+
+def _split_items(items: Sequence[str], max_length: int, /) -> Sequence[str]:
+    if all(len(item) <= max_length for item in items):
+        return items
+    return [part for item in items for part in split_item(item, max_length)]
+
+
+def pack_items(
+    items: Sequence[str],
+    *,
+    items_per_page: int,
+    max_page_length: int,
+    join_items_with: str = "\n",
+) -> list[int]:
+    step = len(join_items_with)
+    # prefix[x] is the length of items[:x] with a separator after every item. a page
+    # spanning items[start:end] therefore has a length of prefix[end] - prefix[start] - step,
+    # which allows finding the end of every page with a binary search.
+    prefix = list(itertools.accumulate((len(item) + step for item in items), initial=0))
+    bounds = [0]
+    start, total = 0, len(items)
+    while start < total:
+        end = bisect.bisect_right(prefix, prefix[start] + max_page_length + step, lo=start + 1) - 1
+        end = min(max(end, start + 1), start + items_per_page)
+        bounds.append(end)
+        start = end
+    return bounds
+
+
+class PageSetCache:
+
+    def __init__(
+        self,
+        *,
+        ttl: float | None = 300.0,
+        max_entries: int | None = 128,
+        cache: BaseCache | None = None,
+        renderer: PageRenderer | None = None,
+    ) -> None:
+        # pages are stored by key in a normal cache, so they expire after 'ttl' seconds and
+        # are rebuilt from fresh items by the next paginator that asks for them.
+        self.cache: BaseCache = cache if cache is not None else RenderCache(max_entries=max_entries, ttl=ttl)
+        # pages are built by the renderer when given one, to keep large builds off of the
+        # event loop.
+        self.renderer: PageRenderer | None = renderer
+        self._tasks: dict[Hashable, asyncio.Task[BasePages]] = {}
+
+    async def get(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        /,
+        *,
+        items_per_page: int,
+        join_items: bool = True,
+        join_items_with: str = "\n",
+        lazy: bool = False,
+        max_built_pages: int = 10,
+        max_page_length: int | None = None,
+    ) -> BasePages:
+        if (pages := self.cache.get(key)) is not None:
+            return pages
+        # concurrent requests for pages that aren't cached yet share a single build
+        if (task := self._tasks.get(key)) is None:
+            task = asyncio.create_task(
+                self._build(
+                    key,
+                    factory,
+                    items_per_page=items_per_page,
+                    join_items=join_items,
+                    join_items_with=join_items_with,
+                    lazy=lazy,
+                    max_built_pages=max_built_pages,
+                    max_page_length=max_page_length,
+                )
+            )
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: Hashable, /) -> None:
+        self.cache.delete(key)
+
+    async def _build(self, key: Hashable, factory: Callable[[], Any], /, **options: Any) -> BasePages:
+        result = factory()
+        if inspect.isawaitable(result):
+            result = await result
+        items: Iterable[Any] | AsyncIterable[Any] | AsyncPageSource | BasePages = result
+        # eager builds join every page, and lazy ones still split and pack their items up
+        # front when given a 'max_page_length', so both are left to the renderer.
+        if (
+            self.renderer is not None
+            and isinstance(items, Sequence)
+            and (not options["lazy"] or options["max_page_length"] is not None)
+        ):
+            pages = await self.renderer.render(build_pages, items, **options)
+        else:
+            pages = build_pages(items, **options)
+        self.cache.set(key, pages)
+        return pages
+
+
+def build_pages(
+    items: Iterable[Any] | AsyncIterable[Any] | AsyncPageSource | BasePages,
+    *,
+    items_per_page: int,
+    join_items: bool = True,
+    join_items_with: str = "\n",
+    lazy: bool = False,
+    max_built_pages: int = 10,
+    max_page_length: int | None = None,
+) -> BasePages:
+    # pages that were already built (e.g. by a 'PageSetCache') are shared as they are
+    if isinstance(items, BasePages):
+        return items
+    if isinstance(items, AsyncPageSource):
+        if max_page_length is not None:
+            raise ValueError("'max_page_length' can not be used with an 'AsyncPageSource'.")
+        return SourcePages(
+            items,
+            items_per_page=items_per_page,
+            join_items=join_items,
+            join_items_with=join_items_with,
+            max_built_pages=max_built_pages,
+        )
+    if not isinstance(items, Sequence):
+        return StreamPages(
+            items,
+            items_per_page=items_per_page,
+            join_items=join_items,
+            join_items_with=join_items_with,
+            max_built_pages=max_built_pages,
+            max_page_length=max_page_length,
+        )
+    if lazy:
+        return LazyPages(
+            items,
+            items_per_page=items_per_page,
+            join_items=join_items,
+            join_items_with=join_items_with,
+            max_built_pages=max_built_pages,
+            max_page_length=max_page_length,
+        )
+    return EagerPages(
+        items,
+        items_per_page=items_per_page,
+        join_items=join_items,
+        join_items_with=join_items_with,
+        max_page_length=max_page_length,
+    )
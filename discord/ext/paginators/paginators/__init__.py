@@ -1,3 +1,4 @@
+from .attachments import *
 from .base import *
 from .embed import *
 from .embeds import *
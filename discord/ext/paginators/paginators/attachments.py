@@ -0,0 +1,154 @@
+import asyncio
+from collections.abc import AsyncIterable, Iterable, Sequence
+
+import discord
+
+from .base import BasePaginator
+from ..attachments import AttachmentStager, PageFile
+from ..callbacks import disable_view, remove_view
+from ..controllers import DefaultController
+from ..dispatch import EditDispatcher, default_dispatcher
+from ..metrics import MetricsSink
+from ..pages import AsyncPageSource, BasePages
+from ..persistence import PaginatorPersistence
+from ..registry import PaginatorRegistry, default_registry
+from ..templates import EmbedTemplate
+from ..types import PaginatorStopCallback, ContextT, ControllerT
+
+
+__all__ = ["AttachmentPaginator"]
+
+
+class AttachmentPaginator(BasePaginator[ContextT, ControllerT]):
+
+    __slots__ = (
+        "stager",
+        "template",
+        "prefetch",
+        "_serialized_embeds",
+        "_tasks",
+    )
+
+    def __init__(
+        self,
+        *,
+        # context
+        ctx: ContextT,
+        # pages
+        files: Iterable[PageFile] | AsyncIterable[PageFile] | AsyncPageSource | BasePages,
+        files_per_page: int = 1,
+        lazy: bool = False,
+        max_built_pages: int = 10,
+        # page
+        initial_page: int = 1,
+        # settings
+        controller: type[ControllerT] = DefaultController,
+        timeout: float = 300.0,
+        on_timeout: PaginatorStopCallback = disable_view,
+        on_stop_button_press: PaginatorStopCallback = remove_view,
+        edit_delay: float = 0.0,
+        response_deadline: float = 2.5,
+        registry: PaginatorRegistry | None = default_registry,
+        dispatcher: EditDispatcher | None = default_dispatcher,
+        persistence: PaginatorPersistence | None = None,
+        persistence_key: str | None = None,
+        metrics: MetricsSink | None = None,
+        ephemeral: bool = False,
+        shared: bool = False,
+        # attachment paginator
+        stager: AttachmentStager,
+        embed: discord.Embed | EmbedTemplate | None = None,
+        prefetch: int = 1,
+    ) -> None:
+        if files_per_page > 10:
+            raise ValueError("'files_per_page' must be less than or equal to 10.")
+        super().__init__(
+            ctx=ctx,
+            items=files,
+            items_per_page=files_per_page,
+            join_items=False,
+            lazy=lazy,
+            max_built_pages=max_built_pages,
+            initial_page=initial_page,
+            controller=controller,
+            timeout=timeout,
+            on_timeout=on_timeout,
+            on_stop_button_press=on_stop_button_press,
+            edit_delay=edit_delay,
+            response_deadline=response_deadline,
+            registry=registry,
+            dispatcher=dispatcher,
+            persistence=persistence,
+            persistence_key=persistence_key,
+            metrics=metrics,
+            ephemeral=ephemeral,
+            shared=shared,
+        )
+        # files are uploaded once through the stager and pages only reference their urls,
+        # so page changes never re-upload them.
+        self.stager: AttachmentStager = stager
+        self.template: EmbedTemplate = (
+            embed if isinstance(embed, EmbedTemplate) else EmbedTemplate(embed or discord.Embed())
+        )
+        if prefetch < 0:
+            raise ValueError("'prefetch' must be greater than or equal to 0.")
+        self.prefetch: int = prefetch
+        self._serialized_embeds: str = ""
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def update_page_content(self) -> None:
+        self.embeds, self._serialized_embeds = await self._render_files(self.page)
+
+    async def render_page(self, page: int, /) -> tuple[str | None, list[discord.Embed]]:
+        embeds, _ = await self._render_files(page)
+        return None, embeds
+
+    def get_page_text(self, page: Sequence[PageFile], /) -> str:
+        return "\n".join(
+            text
+            for file in page
+            for text in (file.filename, file.description)
+            if text
+        )
+
+    async def stop(self, *, callback: PaginatorStopCallback) -> None:
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        await super().stop(callback=callback)
+
+    def _serialize_embeds(self) -> str:
+        return self._serialized_embeds
+
+    async def _render_files(self, page: int, /) -> tuple[list[discord.Embed], str]:
+        files: Sequence[PageFile] = self.pages[page - 1]
+        if len(files) > 1:
+            urls = await self.stager.stage(files)
+        else:
+            urls = [await self.stager.url(file) for file in files]
+        # embeds sharing a 'url' are shown as a single embed with a gallery of their images
+        rendered = [self.template.render(image=url) for url in urls]
+        self._stage_upcoming(page)
+        return (
+            [embed for embed, _ in rendered],
+            f"[{', '.join(serialized[1:-1] for _, serialized in rendered)}]",
+        )
+
+    # prefetching
+
+    def _stage_upcoming(self, page: int, /) -> None:
+        if self.prefetch == 0:
+            return
+        task = asyncio.create_task(self._stage(range(page + 1, page + 1 + self.prefetch)))
+        # failed uploads are retried when their page is shown, so don't warn about them here
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        task.add_done_callback(self._tasks.discard)
+        self._tasks.add(task)
+
+    async def _stage(self, pages: Iterable[int], /) -> None:
+        files: list[PageFile] = []
+        for page in pages:
+            if not await self.pages.load(page):
+                break
+            files.extend(self.pages[page - 1])
+        await self.stager.stage(files)
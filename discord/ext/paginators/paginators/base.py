@@ -1,30 +1,103 @@
 import abc
-import contextlib
-from collections.abc import Sequence
+import asyncio
+import json
+import sys
+import time
+from collections.abc import AsyncIterable, Iterable
 from typing import Any, Generic
 
 import discord
 
 from ..callbacks import disable_view, remove_view
 from ..controllers import DefaultController
+from ..dispatch import EditDispatcher, default_dispatcher
+from ..metrics import MetricsSink
+from ..pages import AsyncPageSource, BasePages, build_pages
+from ..persistence import PaginatorPersistence
+from ..registry import PaginatorRegistry, default_registry
+from ..search import SearchIndex
 from ..types import ContextT, ControllerT, PaginatorStopCallback
 
 
 __all__ = ["BasePaginator"]
 
 
+# interaction tokens last 15 minutes, cursors stop using theirs a little before that
+_CURSOR_TOKEN_LIFETIME: float = 14 * 60.0
+
+# pages indexed or scanned by a search before it lets other tasks run
+_SEARCH_BATCH_SIZE: int = 100
+
+# errors from sending edits and responses that are counted rather than raised. rate limits
+# longer than the clients 'max_ratelimit_timeout' raise 'RateLimited', which isn't an
+# 'HTTPException'.
+_SUPPRESSED_ERRORS: tuple[type[Exception], ...] = (discord.HTTPException, discord.RateLimited)
+
+
+class _Cursor:
+
+    __slots__ = (
+        "page",
+        "message",
+        "expires",
+    )
+
+    def __init__(self, page: int, /) -> None:
+        self.page: int = page
+        self.message: discord.Message | None = None
+        self.expires: float = 0.0
+
+
 class BasePaginator(abc.ABC, Generic[ContextT, ControllerT]):
 
+    __slots__ = (
+        "ctx",
+        "author_id",
+        "ephemeral",
+        "shared",
+        "items_per_page",
+        "pages",
+        "page",
+        "controller",
+        "timeout",
+        "on_timeout",
+        "on_stop_button_press",
+        "edit_delay",
+        "response_deadline",
+        "registry",
+        "dispatcher",
+        "persistence",
+        "persistence_key",
+        "metrics",
+        "message",
+        "view",
+        "_stopping",
+        "content",
+        "embeds",
+        "_edit_task",
+        "_edit_requested",
+        "_interactions",
+        "_responses",
+        "_sent",
+        "_pages_viewed",
+        "_search_index",
+        "_owns_pages",
+        "_cursors",
+    )
+
     def __init__(
         self,
         *,
         # context
         ctx: ContextT,
         # pages
-        items: Sequence[Any],
+        items: Iterable[Any] | AsyncIterable[Any] | AsyncPageSource | BasePages,
         items_per_page: int,
         join_items: bool = True,
         join_items_with: str = "\n",
+        lazy: bool = False,
+        max_built_pages: int = 10,
+        max_page_length: int | None = None,
         # page
         initial_page: int = 1,
         # settings
@@ -32,19 +105,47 @@ class BasePaginator(abc.ABC, Generic[ContextT, ControllerT]):
         timeout: float = 300.0,
         on_timeout: PaginatorStopCallback = disable_view,
         on_stop_button_press: PaginatorStopCallback = remove_view,
+        edit_delay: float = 0.0,
+        response_deadline: float = 2.5,
+        registry: PaginatorRegistry | None = default_registry,
+        dispatcher: EditDispatcher | None = default_dispatcher,
+        persistence: PaginatorPersistence | None = None,
+        persistence_key: str | None = None,
+        metrics: MetricsSink | None = None,
+        ephemeral: bool = False,
+        shared: bool = False,
     ) -> None:
         # context
         self.ctx: ContextT = ctx
+        self.author_id: int = ctx.user.id if isinstance(ctx, discord.Interaction) else ctx.author.id
+        self.ephemeral: bool = ephemeral
+        # shared paginators send one public message that anyone can use, each user gets their
+        # own ephemeral cursor that is shown with the same pages and controller.
+        if shared and ephemeral:
+            raise ValueError("'shared' and 'ephemeral' can not be used together.")
+        if shared and persistence is not None:
+            raise ValueError("'shared' and 'persistence' can not be used together.")
+        if shared and type(self).render_page is BasePaginator.render_page:
+            raise TypeError(f"'{type(self).__name__}' must implement 'render_page' to be shared.")
+        self.shared: bool = shared
         # pages
         if items_per_page <= 0:
             raise ValueError("'items_per_page' must be greater than 0.")
-        self.items_per_page = items_per_page
-        self.pages: Sequence[Any] = [
-            join_items_with.join(items[x:x + items_per_page]) if join_items else items[x:x + items_per_page]
-            for x in range(0, len(items), items_per_page)
-        ]
+        self.pages: BasePages = build_pages(
+            items,
+            items_per_page=items_per_page,
+            join_items=join_items,
+            join_items_with=join_items_with,
+            lazy=lazy,
+            max_built_pages=max_built_pages,
+            max_page_length=max_page_length,
+        )
+        # shared pages keep the options they were built with, and are never modified in place
+        # since other paginators (or a 'PageSetCache') may be showing them too.
+        self.items_per_page: int = self.pages.items_per_page
+        self._owns_pages: bool = not isinstance(items, BasePages)
         # page
-        if initial_page <= 0 or initial_page > len(self.pages):
+        if initial_page <= 0 or (self.pages.complete and initial_page > len(self.pages)):
             raise ValueError(f"'initial_page' must be between 1 and {len(self.pages)} (inclusive).")
         self.page: int = initial_page
         # settings
@@ -52,48 +153,408 @@ class BasePaginator(abc.ABC, Generic[ContextT, ControllerT]):
         self.timeout: float = timeout
         self.on_timeout: PaginatorStopCallback = on_timeout
         self.on_stop_button_press: PaginatorStopCallback = on_stop_button_press
+        if edit_delay < 0:
+            raise ValueError("'edit_delay' must be greater than or equal to 0.")
+        self.edit_delay: float = edit_delay
+        # interactions have to be responded to within 3 seconds, so page changes that take
+        # longer than this are deferred and edited in through a followup once they are done.
+        if not 0 < response_deadline < 3:
+            raise ValueError("'response_deadline' must be greater than 0 and less than 3.")
+        self.response_deadline: float = response_deadline
+        # paginators tracked by a registry have their timeouts handled by it, rather
+        # than by a timer on each controller.
+        self.registry: PaginatorRegistry | None = registry
+        # edits that aren't interaction responses go through the dispatcher, which queues
+        # them per channel and retries them when rate limited.
+        self.dispatcher: EditDispatcher | None = dispatcher
+        if persistence is not None and persistence_key is None:
+            raise ValueError("'persistence_key' must be given when using 'persistence'.")
+        self.persistence: PaginatorPersistence | None = persistence
+        self.persistence_key: str | None = persistence_key
+        self.metrics: MetricsSink | None = metrics
 
         # message
         self.message: discord.Message | None = None
         self.view: ControllerT = discord.utils.MISSING
+        # set while the stop callback runs, so that a second stop (e.g. a timeout firing
+        # alongside the stop button) doesn't run it again.
+        self._stopping: bool = False
         self.content: str | None = None
         self.embeds: list[discord.Embed] = []
+        # edits
+        self._edit_task: asyncio.Task[None] | None = None
+        self._edit_requested: bool = False
+        self._interactions: list[discord.Interaction] = []
+        self._responses: dict[int, asyncio.TimerHandle | asyncio.Task[None]] = {}
+        self._sent: dict[str, Any] = {}
+        # metrics
+        self._pages_viewed: int = 0
+        # search
+        self._search_index: SearchIndex | None = None
+        # shared
+        # only created for shared paginators, so that the others don't pay for them
+        self._cursors: dict[int, _Cursor] | None = {} if shared else None
 
     # base methods
 
     async def start(self) -> None:
         if self.message is not None:
             return
+        started = time.perf_counter() if self.metrics is not None else 0.0
+        # streamed pages are only known once they have been loaded
+        if not await self.pages.load(self.page):
+            raise ValueError(f"'initial_page' must be between 1 and {len(self.pages)} (inclusive).")
         #
         self.view = self.controller(self)
-        self.view.update_item_states()
-        await self.update_page_content()
+        await self._render()
         #
-        self.message = await self.ctx.reply(
-            content=self.content, embeds=self.embeds,
-            view=self.view
+        sent = time.perf_counter() if self.metrics is not None else 0.0
+        self.message = await self._send()
+        self._sent = self._fingerprint()
+        self._pages_viewed = 1
+        if self.metrics is not None:
+            now = time.perf_counter()
+            self.metrics.observe("send", now - sent, paginator=self)
+            self.metrics.observe("first_page", now - started, paginator=self)
+        if self.registry is not None:
+            self.registry.register(self)
+        if self.persistence is not None:
+            await self.persistence.save(self)
+
+    async def _send(self) -> discord.Message:
+        if not isinstance(self.ctx, discord.Interaction):
+            return await self.ctx.reply(
+                content=self.content, embeds=self.embeds,
+                view=self.view, ephemeral=self.ephemeral
+            )
+        return await self._send_response(
+            self.ctx, content=self.content, embeds=self.embeds, ephemeral=self.ephemeral
         )
 
-    async def change_page(self, page: int, /) -> None:
+    async def _send_response(
+        self,
+        interaction: discord.Interaction,
+        /,
+        *,
+        content: str | None,
+        embeds: list[discord.Embed],
+        ephemeral: bool,
+    ) -> discord.Message:
+        # interactions that were already responded to (e.g. deferred) have to use a followup
+        if interaction.response.is_done():
+            return await interaction.followup.send(
+                content=content or discord.utils.MISSING, embeds=embeds,
+                view=self.view, ephemeral=ephemeral, wait=True
+            )
+        # noinspection PyUnresolvedReferences
+        response = await interaction.response.send_message(
+            content=content, embeds=embeds,
+            view=self.view, ephemeral=ephemeral
+        )
+        # newer versions of discord.py return the sent message, older ones need it fetched
+        if isinstance(message := getattr(response, "resource", None), discord.InteractionMessage):
+            return message
+        return await interaction.original_response()
+
+    async def resume(self, message: discord.Message, /, *, page: int) -> None:
+        if self.message is not None:
+            return
+        if page <= 0 or not await self.pages.load(page):
+            raise ValueError(f"'page' must be between 1 and {len(self.pages)} (inclusive).")
+        self.page = page
+        # attach to an already sent message, the next page change will send our view
+        self.view = self.controller(self)
+        self.view.update_item_states()
+        self.message = message
+        if self.registry is not None:
+            self.registry.register(self)
+
+    async def change_page(self, page: int, /, *, interaction: discord.Interaction | None = None) -> None:
+        if self.shared and interaction is not None:
+            await self._change_cursor_page(page, interaction)
+            return
+        if interaction is not None:
+            self._track_response(interaction)
         if self.message is None:
+            if interaction is not None:
+                await self._acknowledge(interaction)
             return
         # check if page is valid
-        if page <= 0 or page > len(self.pages):
+        complete = self.pages.complete
+        if page <= 0 or not await self.pages.load(page):
+            if self._found_last_page(page, complete):
+                # show the now known total instead, controllers laid out for it are replaced.
+                # shared views are left as they are since cursor messages still use them.
+                if not self.shared and self.view.layout() != self.view.created_layout:
+                    self.view.stop()
+                    self.view = self.controller(self)
+                await self.change_page(self.page, interaction=interaction)
+                return
+            if interaction is not None:
+                await self._acknowledge(interaction)
             raise ValueError(f"'page' must be between 1 and {len(self.pages)} (inclusive).")
         self.page = page
+        # the interaction is responded to with the edit itself, rather than being deferred
+        if interaction is not None:
+            self._interactions.append(interaction)
+        # coalesce page changes into a single edit task, so that there is only ever one
+        # edit in flight and it always shows the latest page.
+        self._edit_requested = True
+        if self._edit_task is None or self._edit_task.done():
+            self._edit_task = asyncio.create_task(self._run_edits())
+        task = self._edit_task
+        await asyncio.wait((task,))
+        if not task.cancelled():
+            task.result()
+
+    async def _run_edits(self) -> None:
+        while self._edit_requested:
+            if self.edit_delay > 0:
+                await asyncio.sleep(self.edit_delay)
+            self._edit_requested = False
+            # respond to the latest interaction with the edit, the ones whose page changes
+            # were merged into it only need acknowledging.
+            interactions, self._interactions = self._interactions, []
+            interaction = interactions.pop() if interactions else None
+            for merged in interactions:
+                await self._acknowledge(merged)
+            if self.message is None:
+                if interaction is not None:
+                    await self._acknowledge(interaction)
+                return
+            await self._render()
+            # only send the parts of the message that changed since the last edit, or
+            # skip the edit entirely if nothing did.
+            fingerprint = self._fingerprint()
+            payload: dict[str, Any] = {
+                key: getattr(self, key) for key, value in fingerprint.items()
+                if self._sent.get(key, discord.utils.MISSING) != value
+            }
+            if not payload:
+                if interaction is not None:
+                    await self._acknowledge(interaction)
+                if self.metrics is not None:
+                    self.metrics.increment("skipped_edits", paginator=self)
+                continue
+            # edit message
+            edited = time.perf_counter() if self.metrics is not None else 0.0
+            try:
+                if interaction is None:
+                    if self.dispatcher is not None:
+                        await self.dispatcher.edit(self.message, **payload)
+                    else:
+                        await self.message.edit(**payload)
+                else:
+                    await self._claim_response(interaction)
+                    if not interaction.response.is_done():
+                        # noinspection PyUnresolvedReferences
+                        await interaction.response.edit_message(**payload)
+                    else:
+                        await interaction.edit_original_response(**payload)
+            except _SUPPRESSED_ERRORS:
+                if self.metrics is not None:
+                    self.metrics.increment("suppressed_errors", paginator=self)
+            else:
+                self._sent = fingerprint
+                if self.metrics is not None:
+                    self.metrics.observe("edit", time.perf_counter() - edited, paginator=self)
+            self._pages_viewed += 1
+            if self.persistence is not None:
+                await self.persistence.save(self)
+
+    # shared
+
+    def page_for(self, interaction: discord.Interaction | None = None, /) -> int:
+        # the page that the user of the interaction is on, users of shared paginators that
+        # don't have a cursor yet are on the page of the public message.
+        if self._cursors is None or interaction is None:
+            return self.page
+        if (cursor := self._cursors.get(interaction.user.id)) is not None:
+            return cursor.page
+        return self.page
+
+    async def render_page(self, page: int, /) -> tuple[str | None, list[discord.Embed]]:
+        # returns the content and embeds of a page without changing the paginators own state,
+        # which shared paginators use to render the pages of their cursors.
+        raise NotImplementedError
+
+    async def close_cursor(self, interaction: discord.Interaction, /) -> None:
+        cursor = self._cursors.pop(interaction.user.id, None) if self._cursors is not None else None
+        await self._defer(interaction)
+        if cursor is None or cursor.message is None:
+            return
+        try:
+            await cursor.message.delete()
+        except _SUPPRESSED_ERRORS:
+            if self.metrics is not None:
+                self.metrics.increment("suppressed_errors", paginator=self)
+
+    async def _change_cursor_page(self, page: int, interaction: discord.Interaction, /) -> None:
+        assert self._cursors is not None
+        self._track_response(interaction)
+        if self.message is None:
+            await self._acknowledge(interaction)
+            return
+        complete = self.pages.complete
+        if page <= 0 or not await self.pages.load(page):
+            if self._found_last_page(page, complete):
+                # show the now known total on the public message, and on the users cursor if
+                # they have one.
+                await self.change_page(self.page)
+                if interaction.user.id in self._cursors:
+                    await self._change_cursor_page(self.page_for(interaction), interaction)
+                else:
+                    await self._acknowledge(interaction)
+                return
+            await self._acknowledge(interaction)
+            raise ValueError(f"'page' must be between 1 and {len(self.pages)} (inclusive).")
+        if (cursor := self._cursors.get(interaction.user.id)) is None:
+            cursor = self._cursors[interaction.user.id] = _Cursor(page)
+        cursor.page = page
+        # cursors are rendered from their page alone, so the paginators own page and content
+        # are left as they are. a newer page change by the same user responds instead of this one.
+        content, embeds = await self.render_page(page)
+        if cursor.page != page:
+            await self._acknowledge(interaction)
+            return
+        await self._claim_response(interaction)
+        clicked = interaction.message is not None and cursor.message is not None \
+            and interaction.message.id == cursor.message.id
+        # the token of the interaction that sent the cursors message expires after 15 minutes,
+        # after which it can only be edited by an interaction on the message itself.
+        reusable = cursor.message is not None and asyncio.get_running_loop().time() < cursor.expires
+        if not clicked and reusable:
+            await self._defer(interaction)
+        edited = time.perf_counter() if self.metrics is not None else 0.0
+        # the view is shared as well, so its items are set to the cursors state right before
+        # sending. discord.py converts the view to components before its first await, so
+        # there is no chance for another cursor to change them in between.
+        self._set_item_states(page)
+        try:
+            if clicked:
+                if not interaction.response.is_done():
+                    # noinspection PyUnresolvedReferences
+                    await interaction.response.edit_message(content=content, embeds=embeds, view=self.view)
+                else:
+                    await interaction.edit_original_response(content=content, embeds=embeds, view=self.view)
+            elif reusable:
+                assert cursor.message is not None
+                await cursor.message.edit(content=content, embeds=embeds, view=self.view)
+            else:
+                cursor.message = await self._send_response(interaction, content=content, embeds=embeds, ephemeral=True)
+                cursor.expires = asyncio.get_running_loop().time() + _CURSOR_TOKEN_LIFETIME
+        except _SUPPRESSED_ERRORS:
+            if self.metrics is not None:
+                self.metrics.increment("suppressed_errors", paginator=self)
+        else:
+            if self.metrics is not None:
+                self.metrics.observe("edit", time.perf_counter() - edited, paginator=self)
+        finally:
+            self._set_item_states(self.page)
+        self._pages_viewed += 1
+
+    def _found_last_page(self, page: int, complete: bool, /) -> bool:
+        # sources without a count whose last page is full only find out that it was their last
+        # once the page after it comes back empty. going there was valid as far as the viewer
+        # could tell, so it isn't treated as an invalid page.
+        return not complete and self.pages.complete and page == len(self.pages) + 1
+
+    def _set_item_states(self, page: int, /) -> None:
+        index, self.page = self.page, page
+        try:
+            self.view.update_item_states()
+        finally:
+            self.page = index
+
+    # responses
+
+    def _track_response(self, interaction: discord.Interaction, /) -> None:
+        if interaction.id in self._responses or interaction.response.is_done():
+            return
+        self._responses[interaction.id] = asyncio.get_running_loop().call_later(
+            self.response_deadline, self._respond_late, interaction
+        )
+
+    def _respond_late(self, interaction: discord.Interaction, /) -> None:
+        if self.metrics is not None:
+            self.metrics.increment("late_responses", paginator=self)
+        task = asyncio.create_task(self._defer(interaction))
+        task.add_done_callback(lambda _: self._responses.pop(interaction.id, None))
+        # the interaction fails on its own if this does, so don't warn about it here
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._responses[interaction.id] = task
+
+    async def _claim_response(self, interaction: discord.Interaction, /) -> None:
+        # stop the interaction from being deferred, or wait for it to be if that has started
+        response = self._responses.pop(interaction.id, None)
+        if isinstance(response, asyncio.TimerHandle):
+            response.cancel()
+        elif response is not None:
+            await asyncio.wait((response,))
+
+    async def _acknowledge(self, interaction: discord.Interaction, /) -> None:
+        await self._claim_response(interaction)
+        await self._defer(interaction)
+
+    async def _defer(self, interaction: discord.Interaction, /) -> None:
+        if interaction.response.is_done():
+            return
+        deferred = time.perf_counter() if self.metrics is not None else 0.0
+        try:
+            # noinspection PyUnresolvedReferences
+            await interaction.response.defer()
+        except _SUPPRESSED_ERRORS:
+            # the interaction fails on its own, which is all a failed defer would do anyway
+            if self.metrics is not None:
+                self.metrics.increment("suppressed_errors", paginator=self)
+            return
+        if self.metrics is not None:
+            self.metrics.observe("defer", time.perf_counter() - deferred, paginator=self)
+
+    def _fingerprint(self) -> dict[str, Any]:
+        # embeds are serialised as their dicts share state with the embed objects, and interned
+        # so that sessions showing the same page share them.
+        return {
+            "content": self.content,
+            "embeds": self._serialize_embeds(),
+            "view": json.dumps(self.view.to_components(), sort_keys=True),
+        }
+
+    def _serialize_embeds(self) -> str:
+        return sys.intern(json.dumps([embed.to_dict() for embed in self.embeds], sort_keys=True))
+
+    async def _render(self) -> None:
+        rendered = time.perf_counter() if self.metrics is not None else 0.0
         # set new controllers state + page contents
         self.view.update_item_states()
         await self.update_page_content()
-        # edit message
-        with contextlib.suppress(discord.NotFound, discord.HTTPException):
-            await self.message.edit(
-                content=self.content, embeds=self.embeds,
-                view=self.view
-            )
+        if self.metrics is not None:
+            self.metrics.observe("render", time.perf_counter() - rendered, paginator=self)
 
     async def stop(self, *, callback: PaginatorStopCallback) -> None:
-        if self.message is None:
+        if self.message is None or self._stopping:
             return
+        self._stopping = True
+        try:
+            await self._stop(callback)
+        finally:
+            self._stopping = False
+
+    async def _stop(self, callback: PaginatorStopCallback, /) -> None:
+        if self.registry is not None:
+            self.registry.unregister(self)
+        if self.persistence is not None:
+            await self.persistence.delete(self)
+        if self.metrics is not None:
+            self.metrics.observe("pages_viewed", self._pages_viewed, paginator=self)
+        # cancel pending edits so they can't land after the stop actions
+        if self._edit_task is not None:
+            self._edit_task.cancel()
+            self._edit_task = None
+        # interactions that were waiting on them are still deferred once their deadline passes
+        self._interactions.clear()
+        if self._cursors is not None:
+            self._cursors.clear()
         # enact stop actions
         await callback(self)
         self.view.stop()
@@ -101,19 +562,113 @@ class BasePaginator(abc.ABC, Generic[ContextT, ControllerT]):
         self.message = None
         self.view = discord.utils.MISSING
 
+    async def search(self, term: str, /, *, interaction: discord.Interaction | None = None) -> int | None:
+        # building the index takes a while for many pages (and fetches every page of a source),
+        # so the interaction that asked for the search is deferred if it isn't done in time.
+        if interaction is not None:
+            self._track_response(interaction)
+        # the index is built once on the first search, candidate pages it returns are then
+        # checked for the full term since the index only knows about individual words. pages
+        # are loaded one at a time before being read, as sources only keep a window of them.
+        if self._search_index is None:
+            index = SearchIndex()
+            page = 1
+            while await self.pages.load(page):
+                index.add(page, self.get_page_text(self.pages[page - 1]))
+                # let other tasks run in between batches of pages, rather than blocking the
+                # event loop until every page has been indexed.
+                if page % _SEARCH_BATCH_SIZE == 0:
+                    await asyncio.sleep(0)
+                page += 1
+            self._search_index = index
+        term = term.lower()
+        # terms without any words in them can only be found by checking every page
+        if (candidates := self._search_index.candidates(term)) is None:
+            page = 1
+            while await self.pages.load(page):
+                if await self._page_contains(page, term):
+                    return page
+                if page % _SEARCH_BATCH_SIZE == 0:
+                    await asyncio.sleep(0)
+                page += 1
+            return None
+        for page in candidates:
+            if await self._page_contains(page, term):
+                return page
+        # the words at the edges of the term may be part of longer words ("layer" in "player"),
+        # pages with such words are only checked once the term wasn't found as whole words.
+        checked = set(candidates)
+        for page in self._search_index.candidates(term, partial=True) or []:
+            if page not in checked and await self._page_contains(page, term):
+                return page
+        return None
+
+    async def _page_contains(self, page: int, term: str, /) -> bool:
+        return await self.pages.load(page) and term in self.get_page_text(self.pages[page - 1]).lower()
+
+    async def notify(self, interaction: discord.Interaction, content: str, /) -> None:
+        # sends an ephemeral message in response to an interaction, through a followup if it
+        # was deferred while the paginator was busy with it.
+        await self._claim_response(interaction)
+        try:
+            if interaction.response.is_done():
+                await interaction.followup.send(content, ephemeral=True)
+            else:
+                # noinspection PyUnresolvedReferences
+                await interaction.response.send_message(content, ephemeral=True)
+        except _SUPPRESSED_ERRORS:
+            if self.metrics is not None:
+                self.metrics.increment("suppressed_errors", paginator=self)
+
+    # live pages
+
+    async def extend(self, items: Iterable[Any], /, *, follow: bool = False) -> None:
+        if not self._owns_pages:
+            raise TypeError("Pages that were given already built can not be extended, as they may be shared.")
+        first = self.pages.extend(list(items))
+        # pages only ever grow at the end, so the index can be caught up rather than rebuilt
+        if self._search_index is not None:
+            for page in range(first, len(self.pages) + 1):
+                self._search_index.add(page, self.get_page_text(self.pages[page - 1]))
+        if self.message is None:
+            return
+        page = len(self.pages) if follow else self.page
+        # controllers with a different layout for the new page count have to be replaced
+        if self.view.layout() != self.view.created_layout:
+            self.view.stop()
+            self.view = self.controller(self)
+            await self.change_page(page)
+        # only edit if the page being viewed changed, otherwise the new page count is shown
+        # whenever the next edit happens.
+        elif page >= first:
+            await self.change_page(page)
+        else:
+            self.view.update_item_states()
+
+    async def append(self, item: Any, /, *, follow: bool = False) -> None:
+        await self.extend((item,), follow=follow)
+
+    def get_page_text(self, page: Any, /) -> str:
+        if isinstance(page, str):
+            return page
+        return "\n".join(map(str, page))
+
     # shortcut methods
 
-    async def go_to_first_page(self) -> None:
-        await self.change_page(1)
+    async def go_to_first_page(self, *, interaction: discord.Interaction | None = None) -> None:
+        await self.change_page(1, interaction=interaction)
 
-    async def go_to_previous_page(self) -> None:
-        await self.change_page(self.page - 1)
+    async def go_to_previous_page(self, *, interaction: discord.Interaction | None = None) -> None:
+        await self.change_page(self.page_for(interaction) - 1, interaction=interaction)
 
-    async def go_to_next_page(self) -> None:
-        await self.change_page(self.page + 1)
+    async def go_to_next_page(self, *, interaction: discord.Interaction | None = None) -> None:
+        await self.change_page(self.page_for(interaction) + 1, interaction=interaction)
 
-    async def go_to_last_page(self) -> None:
-        await self.change_page(len(self.pages))
+    async def go_to_last_page(self, *, interaction: discord.Interaction | None = None) -> None:
+        if interaction is not None:
+            self._track_response(interaction)
+        await self.pages.load_all()
+        await self.change_page(len(self.pages), interaction=interaction)
 
     # abc methods
 
@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterable, Iterable
 
 import discord
 
@@ -6,6 +6,13 @@ from .base import BasePaginator
 from ..callbacks import disable_view, remove_view
 from ..codeblocks import CodeblockType, codeblock
 from ..controllers import DefaultController
+from ..dispatch import EditDispatcher, default_dispatcher
+from ..metrics import MetricsSink
+from ..pages import AsyncPageSource, BasePages
+from ..persistence import PaginatorPersistence
+from ..registry import PaginatorRegistry, default_registry
+from ..renderers import PageRenderer, page_length_budget, render_text_page
+from ..templates import EmbedTemplate
 from ..types import PaginatorStopCallback, ContextT, ControllerT
 
 
@@ -14,15 +21,28 @@ __all__ = ["EmbedTextPaginator"]
 
 class EmbedTextPaginator(BasePaginator[ContextT, ControllerT]):
 
+    __slots__ = (
+        "header",
+        "footer",
+        "codeblock_start",
+        "codeblock_end",
+        "renderer",
+        "template",
+        "_serialized_embeds",
+    )
+
     def __init__(
         self,
         *,
         # context
         ctx: ContextT,
         # pages
-        items: Sequence[str],
+        items: Iterable[str] | AsyncIterable[str] | AsyncPageSource | BasePages,
         items_per_page: int,
         join_items_with: str = "\n",
+        lazy: bool = False,
+        max_built_pages: int = 10,
+        max_page_length: int | None = None,
         # page
         initial_page: int = 1,
         # settings
@@ -30,34 +50,75 @@ class EmbedTextPaginator(BasePaginator[ContextT, ControllerT]):
         timeout: float = 300.0,
         on_timeout: PaginatorStopCallback = disable_view,
         on_stop_button_press: PaginatorStopCallback = remove_view,
+        edit_delay: float = 0.0,
+        response_deadline: float = 2.5,
+        registry: PaginatorRegistry | None = default_registry,
+        dispatcher: EditDispatcher | None = default_dispatcher,
+        persistence: PaginatorPersistence | None = None,
+        persistence_key: str | None = None,
+        metrics: MetricsSink | None = None,
+        ephemeral: bool = False,
+        shared: bool = False,
         # text paginator
         codeblock_type: CodeblockType = CodeblockType.NONE,
         codeblock_language: str | None = None,
         header: str | None = None,
         footer: str | None = None,
+        renderer: PageRenderer | None = None,
         # embed paginator
-        embed: discord.Embed
+        embed: discord.Embed | EmbedTemplate,
     ) -> None:
+        codeblock_start, codeblock_end = codeblock(codeblock_type, language=codeblock_language)
+        header, footer = header or "", footer or ""
+        max_page_length = page_length_budget(max_page_length, codeblock_start, header, footer, codeblock_end)
         super().__init__(
             ctx=ctx,
             items=items,
             items_per_page=items_per_page,
             join_items=True,
             join_items_with=join_items_with,
+            lazy=lazy,
+            max_built_pages=max_built_pages,
+            max_page_length=max_page_length,
             initial_page=initial_page,
             controller=controller,
             timeout=timeout,
             on_timeout=on_timeout,
             on_stop_button_press=on_stop_button_press,
+            edit_delay=edit_delay,
+            response_deadline=response_deadline,
+            registry=registry,
+            dispatcher=dispatcher,
+            persistence=persistence,
+            persistence_key=persistence_key,
+            metrics=metrics,
+            ephemeral=ephemeral,
+            shared=shared,
         )
-        self.header: str = header or ""
-        self.footer: str = footer or ""
-        self.codeblock_start, self.codeblock_end = codeblock(codeblock_type, language=codeblock_language)
-        self.embeds = [embed]
+        self.header: str = header
+        self.footer: str = footer
+        self.codeblock_start: str = codeblock_start
+        self.codeblock_end: str = codeblock_end
+        self.renderer: PageRenderer | None = renderer
+        # the embed is converted to a template (unless it already is one) so that pages are
+        # rendered without mutating it, which lets templates be shared between paginators.
+        self.template: EmbedTemplate = embed if isinstance(embed, EmbedTemplate) else EmbedTemplate(embed)
+        self._serialized_embeds: str = ""
 
     async def update_page_content(self) -> None:
-        self.embeds[0].description = f"{self.codeblock_start}" \
-                                     f"{self.header}\n" \
-                                     f"{self.pages[self.page - 1]}" \
-                                     f"\n{self.footer}" \
-                                     f"{self.codeblock_end}"
+        embed, self._serialized_embeds = self.template.render(
+            description=await self._format_page(self.page - 1)
+        )
+        self.embeds = [embed]
+
+    async def render_page(self, page: int, /) -> tuple[str | None, list[discord.Embed]]:
+        embed, _ = self.template.render(description=await self._format_page(page - 1))
+        return None, [embed]
+
+    async def _format_page(self, index: int, /) -> str:
+        return await render_text_page(
+            self.pages, index, self.renderer, self.codeblock_start, self.header, self.footer, self.codeblock_end
+        )
+
+    def _serialize_embeds(self) -> str:
+        return self._serialized_embeds
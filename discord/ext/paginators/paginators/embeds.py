@@ -1,10 +1,15 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterable, Iterable, Sequence
 
 import discord
 
 from .base import BasePaginator
 from ..callbacks import disable_view, remove_view
 from ..controllers import DefaultController
+from ..dispatch import EditDispatcher, default_dispatcher
+from ..metrics import MetricsSink
+from ..pages import AsyncPageSource, BasePages
+from ..persistence import PaginatorPersistence
+from ..registry import PaginatorRegistry, default_registry
 from ..types import PaginatorStopCallback, ContextT, ControllerT
 
 
@@ -13,14 +18,18 @@ __all__ = ["EmbedsPaginator"]
 
 class EmbedsPaginator(BasePaginator[ContextT, ControllerT]):
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
         # context
         ctx: ContextT,
         # pages
-        embeds: Sequence[discord.Embed],
+        embeds: Iterable[discord.Embed] | AsyncIterable[discord.Embed] | AsyncPageSource | BasePages,
         embeds_per_page: int,
+        lazy: bool = False,
+        max_built_pages: int = 10,
         # page
         initial_page: int = 1,
         # settings
@@ -28,6 +37,15 @@ class EmbedsPaginator(BasePaginator[ContextT, ControllerT]):
         timeout: float = 300.0,
         on_timeout: PaginatorStopCallback = disable_view,
         on_stop_button_press: PaginatorStopCallback = remove_view,
+        edit_delay: float = 0.0,
+        response_deadline: float = 2.5,
+        registry: PaginatorRegistry | None = default_registry,
+        dispatcher: EditDispatcher | None = default_dispatcher,
+        persistence: PaginatorPersistence | None = None,
+        persistence_key: str | None = None,
+        metrics: MetricsSink | None = None,
+        ephemeral: bool = False,
+        shared: bool = False,
     ) -> None:
         if embeds_per_page > 10:
             raise ValueError("'embeds_per_page' must be less than or equal to 10.")
@@ -36,12 +54,34 @@ class EmbedsPaginator(BasePaginator[ContextT, ControllerT]):
             items=embeds,
             items_per_page=embeds_per_page,
             join_items=False,
+            lazy=lazy,
+            max_built_pages=max_built_pages,
             initial_page=initial_page,
             controller=controller,
             timeout=timeout,
             on_timeout=on_timeout,
             on_stop_button_press=on_stop_button_press,
+            edit_delay=edit_delay,
+            response_deadline=response_deadline,
+            registry=registry,
+            dispatcher=dispatcher,
+            persistence=persistence,
+            persistence_key=persistence_key,
+            metrics=metrics,
+            ephemeral=ephemeral,
+            shared=shared,
         )
 
     async def update_page_content(self) -> None:
         self.embeds = self.pages[self.page - 1]
+
+    async def render_page(self, page: int, /) -> tuple[str | None, list[discord.Embed]]:
+        return None, self.pages[page - 1]
+
+    def get_page_text(self, page: Sequence[discord.Embed], /) -> str:
+        return "\n".join(
+            text
+            for embed in page
+            for text in (embed.title, embed.description, *(f"{field.name}\n{field.value}" for field in embed.fields))
+            if text
+        )
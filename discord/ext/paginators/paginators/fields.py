@@ -1,10 +1,16 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterable, Iterable, Sequence
 
 import discord
 
 from .base import BasePaginator
 from ..callbacks import disable_view, remove_view
 from ..controllers import DefaultController
+from ..dispatch import EditDispatcher, default_dispatcher
+from ..metrics import MetricsSink
+from ..pages import AsyncPageSource, BasePages
+from ..persistence import PaginatorPersistence
+from ..registry import PaginatorRegistry, default_registry
+from ..templates import EmbedTemplate
 from ..types import PaginatorStopCallback, ContextT, ControllerT
 
 
@@ -13,14 +19,21 @@ __all__ = ["EmbedFieldsPaginator"]
 
 class EmbedFieldsPaginator(BasePaginator[ContextT, ControllerT]):
 
+    __slots__ = (
+        "template",
+        "_serialized_embeds",
+    )
+
     def __init__(
         self,
         *,
         # context
         ctx: ContextT,
         # pages
-        fields: Sequence[tuple[str, str, bool]],
+        fields: Iterable[tuple[str, str, bool]] | AsyncIterable[tuple[str, str, bool]] | AsyncPageSource | BasePages,
         fields_per_page: int,
+        lazy: bool = False,
+        max_built_pages: int = 10,
         # page
         initial_page: int = 1,
         # settings
@@ -28,8 +41,17 @@ class EmbedFieldsPaginator(BasePaginator[ContextT, ControllerT]):
         timeout: float = 300.0,
         on_timeout: PaginatorStopCallback = disable_view,
         on_stop_button_press: PaginatorStopCallback = remove_view,
+        edit_delay: float = 0.0,
+        response_deadline: float = 2.5,
+        registry: PaginatorRegistry | None = default_registry,
+        dispatcher: EditDispatcher | None = default_dispatcher,
+        persistence: PaginatorPersistence | None = None,
+        persistence_key: str | None = None,
+        metrics: MetricsSink | None = None,
+        ephemeral: bool = False,
+        shared: bool = False,
         # fields paginator specific
-        embed: discord.Embed,
+        embed: discord.Embed | EmbedTemplate,
     ) -> None:
         if fields_per_page > 25:
             raise ValueError("'fields_per_page' must be less than or equal to 25.")
@@ -38,15 +60,38 @@ class EmbedFieldsPaginator(BasePaginator[ContextT, ControllerT]):
             items=fields,
             items_per_page=fields_per_page,
             join_items=False,
+            lazy=lazy,
+            max_built_pages=max_built_pages,
             initial_page=initial_page,
             controller=controller,
             timeout=timeout,
             on_timeout=on_timeout,
             on_stop_button_press=on_stop_button_press,
+            edit_delay=edit_delay,
+            response_deadline=response_deadline,
+            registry=registry,
+            dispatcher=dispatcher,
+            persistence=persistence,
+            persistence_key=persistence_key,
+            metrics=metrics,
+            ephemeral=ephemeral,
+            shared=shared,
         )
-        self.embeds = [embed]
+        # the embed is converted to a template (unless it already is one) so that pages are
+        # rendered without mutating it, which lets templates be shared between paginators.
+        self.template: EmbedTemplate = embed if isinstance(embed, EmbedTemplate) else EmbedTemplate(embed)
+        self._serialized_embeds: str = ""
 
     async def update_page_content(self) -> None:
-        self.embeds[0].clear_fields()
-        for name, value, inline in self.pages[self.page - 1]:
-            self.embeds[0].add_field(name=name, value=value, inline=inline)
+        embed, self._serialized_embeds = self.template.render(fields=self.pages[self.page - 1])
+        self.embeds = [embed]
+
+    async def render_page(self, page: int, /) -> tuple[str | None, list[discord.Embed]]:
+        embed, _ = self.template.render(fields=self.pages[page - 1])
+        return None, [embed]
+
+    def _serialize_embeds(self) -> str:
+        return self._serialized_embeds
+
+    def get_page_text(self, page: Sequence[tuple[str, str, bool]], /) -> str:
+        return "\n".join(f"{name}\n{value}" for name, value, _ in page)
@@ -1,9 +1,17 @@
-from collections.abc import Sequence
+import asyncio
+from collections.abc import Hashable, Sequence
 from typing import Any
 
+import discord
+
 from .base import BasePaginator
+from ..caches import BaseCache, RenderCache
 from ..callbacks import disable_view, remove_view
 from ..controllers import DefaultController
+from ..dispatch import EditDispatcher, default_dispatcher
+from ..metrics import MetricsSink
+from ..persistence import PaginatorPersistence
+from ..registry import PaginatorRegistry, default_registry
 from ..types import PaginatorStopCallback, ContextT, ControllerT
 
 
@@ -12,6 +20,19 @@ __all__ = ["PartialPaginator"]
 
 class PartialPaginator(BasePaginator[ContextT, ControllerT]):
 
+    __slots__ = (
+        "header",
+        "prefetch",
+        "prefetch_previous",
+        "cache",
+        "cache_key",
+        "_tasks",
+        "_semaphore",
+    )
+
+    # pages kept by the default cache, on top of those being prefetched
+    DEFAULT_CACHE_ENTRIES: int = 16
+
     def __init__(
         self,
         *,
@@ -26,8 +47,22 @@ class PartialPaginator(BasePaginator[ContextT, ControllerT]):
         timeout: float = 300.0,
         on_timeout: PaginatorStopCallback = disable_view,
         on_stop_button_press: PaginatorStopCallback = remove_view,
+        edit_delay: float = 0.0,
+        response_deadline: float = 2.5,
+        registry: PaginatorRegistry | None = default_registry,
+        dispatcher: EditDispatcher | None = default_dispatcher,
+        persistence: PaginatorPersistence | None = None,
+        persistence_key: str | None = None,
+        metrics: MetricsSink | None = None,
+        ephemeral: bool = False,
+        shared: bool = False,
         # partial paginator
         header: str | None = None,
+        prefetch: int = 0,
+        prefetch_previous: bool = False,
+        max_concurrent_prefetches: int = 2,
+        cache: BaseCache | None = None,
+        cache_key: Hashable | None = None,
     ) -> None:
         super().__init__(
             ctx=ctx,
@@ -39,13 +74,95 @@ class PartialPaginator(BasePaginator[ContextT, ControllerT]):
             timeout=timeout,
             on_timeout=on_timeout,
             on_stop_button_press=on_stop_button_press,
+            edit_delay=edit_delay,
+            response_deadline=response_deadline,
+            registry=registry,
+            dispatcher=dispatcher,
+            persistence=persistence,
+            persistence_key=persistence_key,
+            metrics=metrics,
+            ephemeral=ephemeral,
+            shared=shared,
         )
         self.header: str = header or ""
-        self._cache: dict[int, str] = {}
+        if prefetch < 0:
+            raise ValueError("'prefetch' must be greater than or equal to 0.")
+        if max_concurrent_prefetches <= 0:
+            raise ValueError("'max_concurrent_prefetches' must be greater than 0.")
+        self.prefetch: int = prefetch
+        self.prefetch_previous: bool = prefetch_previous
+        # pages are cached under (cache_key, page), a cache shared between paginators will
+        # only share renders between those that were given the same 'cache_key'. the default
+        # cache keeps the last few pages and those being prefetched around the current one.
+        self.cache: BaseCache = (
+            cache if cache is not None
+            else RenderCache(max_entries=max(self.DEFAULT_CACHE_ENTRIES, prefetch + 2))
+        )
+        self.cache_key: Hashable = cache_key if cache_key is not None else object()
+        self._tasks: dict[int, asyncio.Task[str]] = {}
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_prefetches)
 
     async def update_page_content(self) -> None:
-        page = self.page - 1
-        if page not in self._cache:
-            async with self.ctx.typing():
-                self._cache[page] = await self.pages[page][0]()
-        self.content = f"{self.header}{self._cache[page]}"
+        self.content, _ = await self.render_page(self.page)
+
+    async def render_page(self, page: int, /) -> tuple[str | None, list[discord.Embed]]:
+        index = page - 1
+        if (content := self.cache.get((self.cache_key, index))) is None:
+            # share the task with a prefetch of the same page if there is one
+            task = self._render_page(index, prefetch=False)
+            if not task.done():
+                # interactions show their own loading state, so only commands need typing
+                if isinstance(self.ctx, discord.Interaction):
+                    await task
+                else:
+                    async with self.ctx.typing():
+                        await task
+            content = task.result()
+        self._prefetch_pages(page)
+        return f"{self.header}{content}", []
+
+    async def search(self, term: str, /, *, interaction: discord.Interaction | None = None) -> int | None:
+        # partials are only known once rendered, so only rendered pages can be searched
+        term = term.lower()
+        for page in range(len(self.pages)):
+            if (self.cache_key, page) not in self.cache:
+                continue
+            if term in (self.cache.get((self.cache_key, page)) or "").lower():
+                return page + 1
+        return None
+
+    async def stop(self, *, callback: PaginatorStopCallback) -> None:
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        await super().stop(callback=callback)
+
+    # prefetching
+
+    def _prefetch_pages(self, page: int, /) -> None:
+        indexes = list(range(page, min(page + self.prefetch, len(self.pages))))
+        if self.prefetch_previous and page >= 2:
+            indexes.append(page - 2)
+        for index in indexes:
+            if (self.cache_key, index) not in self.cache:
+                self._render_page(index, prefetch=True)
+
+    def _render_page(self, page: int, /, *, prefetch: bool) -> asyncio.Task[str]:
+        if (task := self._tasks.get(page)) is None:
+            task = asyncio.create_task(self._render_partial(page, prefetch=prefetch))
+            # failed prefetches are retried when the page is shown, so don't warn about them here
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._tasks[page] = task
+        return task
+
+    async def _render_partial(self, page: int, /, *, prefetch: bool) -> str:
+        try:
+            if prefetch:
+                async with self._semaphore:
+                    content = await self.pages[page][0]()
+            else:
+                content = await self.pages[page][0]()
+            self.cache.set((self.cache_key, page), content)
+            return content
+        finally:
+            self._tasks.pop(page, None)
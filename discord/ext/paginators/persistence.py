@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import json
+import os
+import sqlite3
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import discord
+
+from .controllers import JumpToPageModal, SearchModal
+
+if TYPE_CHECKING:
+    from .paginators import BasePaginator
+    from .types import PaginatorFactory
+
+
+__all__ = [
+    "PaginatorState",
+    "BaseStore",
+    "SQLiteStore",
+    "JSONFileStore",
+    "PaginatorPersistence",
+]
+
+
+class PaginatorState(NamedTuple):
+    message_id: int
+    channel_id: int
+    guild_id: int | None
+    author_id: int
+    page: int
+    key: str
+
+
+# stores
+
+class BaseStore(abc.ABC):
+
+    @abc.abstractmethod
+    async def get(self, message_id: int, /) -> PaginatorState | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def set(self, state: PaginatorState, /) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete(self, message_id: int, /) -> None:
+        raise NotImplementedError
+
+
+class SQLiteStore(BaseStore):
+
+    def __init__(self, path: str | os.PathLike[str] = "paginators.sqlite3") -> None:
+        self.path: str | os.PathLike[str] = path
+        self._connection: sqlite3.Connection | None = None
+        # the connection is used from worker threads, so only allow one of them at a time
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS paginators ("
+                "message_id INTEGER PRIMARY KEY, "
+                "channel_id INTEGER NOT NULL, "
+                "guild_id INTEGER, "
+                "author_id INTEGER NOT NULL, "
+                "page INTEGER NOT NULL, "
+                "key TEXT NOT NULL)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def _get(self, message_id: int, /) -> PaginatorState | None:
+        row = self._connect().execute(
+            "SELECT message_id, channel_id, guild_id, author_id, page, key FROM paginators WHERE message_id = ?",
+            (message_id,)
+        ).fetchone()
+        return PaginatorState(*row) if row is not None else None
+
+    def _set(self, state: PaginatorState, /) -> None:
+        connection = self._connect()
+        connection.execute("INSERT OR REPLACE INTO paginators VALUES (?, ?, ?, ?, ?, ?)", state)
+        connection.commit()
+
+    def _delete(self, message_id: int, /) -> None:
+        connection = self._connect()
+        connection.execute("DELETE FROM paginators WHERE message_id = ?", (message_id,))
+        connection.commit()
+
+    async def get(self, message_id: int, /) -> PaginatorState | None:
+        async with self._lock:
+            return await asyncio.to_thread(self._get, message_id)
+
+    async def set(self, state: PaginatorState, /) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._set, state)
+
+    async def delete(self, message_id: int, /) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._delete, message_id)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class JSONFileStore(BaseStore):
+
+    def __init__(self, path: str | os.PathLike[str] = "paginators.json") -> None:
+        self.path: str | os.PathLike[str] = path
+        self._states: dict[int, PaginatorState] | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def _read(self) -> dict[int, PaginatorState]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data: list[list[Any]] = json.load(file)
+        except FileNotFoundError:
+            return {}
+        return {state[0]: PaginatorState(*state) for state in data}
+
+    def _write(self, states: list[PaginatorState], /) -> None:
+        # write to a temporary file first so that a crash can't leave a half written file behind
+        temporary = f"{os.fspath(self.path)}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(states, file)
+        os.replace(temporary, self.path)
+
+    async def _load(self) -> dict[int, PaginatorState]:
+        if self._states is None:
+            self._states = await asyncio.to_thread(self._read)
+        return self._states
+
+    async def get(self, message_id: int, /) -> PaginatorState | None:
+        async with self._lock:
+            return (await self._load()).get(message_id)
+
+    async def set(self, state: PaginatorState, /) -> None:
+        async with self._lock:
+            states = await self._load()
+            states[state.message_id] = state
+            await asyncio.to_thread(self._write, list(states.values()))
+
+    async def delete(self, message_id: int, /) -> None:
+        async with self._lock:
+            states = await self._load()
+            if states.pop(message_id, None) is not None:
+                await asyncio.to_thread(self._write, list(states.values()))
+
+
+# rehydration
+
+class _RehydrationButton(discord.ui.Button["_RehydrationView"]):
+
+    def __init__(self, name: str, /, *, custom_id: str) -> None:
+        super().__init__(custom_id=custom_id)
+        self.name: str = name
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        assert self.view is not None
+        if self.name in ("jump", "search"):
+            # modals have to be the response to the interaction, so it can't be deferred
+            paginator = await self.view.persistence.rehydrate(interaction)
+            if paginator is None:
+                # noinspection PyUnresolvedReferences
+                await interaction.response.defer()
+                return
+            modal = JumpToPageModal(paginator) if self.name == "jump" else SearchModal(paginator)
+            # noinspection PyUnresolvedReferences
+            await interaction.response.send_modal(modal)
+            return
+        # noinspection PyUnresolvedReferences
+        await interaction.response.defer()
+        paginator = await self.view.persistence.rehydrate(interaction)
+        if paginator is None:
+            return
+        match self.name:
+            case "first":
+                await paginator.go_to_first_page()
+            case "previous":
+                await paginator.go_to_previous_page()
+            case "next":
+                await paginator.go_to_next_page()
+            case "last":
+                await paginator.go_to_last_page()
+            case "stop":
+                await paginator.stop(callback=paginator.on_stop_button_press)
+            case "back_100" | "back_10" | "forward_10" | "forward_100":
+                page = paginator.page + PaginatorPersistence.SKIP_OFFSETS[self.name]
+                await paginator.change_page(min(max(page, 1), len(paginator.pages)))
+            case _:
+                await paginator.change_page(paginator.page)
+
+
+class _RehydrationSelect(discord.ui.Select["_RehydrationView"]):
+
+    async def callback(self, interaction: discord.Interaction) -> None:
+        assert self.view is not None
+        # noinspection PyUnresolvedReferences
+        await interaction.response.defer()
+        paginator = await self.view.persistence.rehydrate(interaction)
+        if paginator is None:
+            return
+        await paginator.change_page(int(self.values[0]))
+
+
+class _RehydrationView(discord.ui.View):
+
+    def __init__(self, persistence: PaginatorPersistence, /) -> None:
+        super().__init__(timeout=None)
+        self.persistence: PaginatorPersistence = persistence
+        for name in PaginatorPersistence.ITEM_NAMES:
+            self.add_item(_RehydrationButton(name, custom_id=persistence.custom_id(name)))
+        self.add_item(_RehydrationSelect(custom_id=persistence.custom_id("ranges")))
+
+
+class PaginatorPersistence:
+
+    ITEM_NAMES: tuple[str, ...] = (
+        "first", "previous", "label", "next", "last", "stop", "jump", "search",
+        "back_100", "back_10", "forward_10", "forward_100",
+    )
+    SKIP_OFFSETS: dict[str, int] = {"back_100": -100, "back_10": -10, "forward_10": 10, "forward_100": 100}
+
+    def __init__(
+        self,
+        *,
+        store: BaseStore,
+        factory: PaginatorFactory,
+        prefix: str = "ext-paginators",
+    ) -> None:
+        self.store: BaseStore = store
+        self.factory: PaginatorFactory = factory
+        self.prefix: str = prefix
+        # message id -> rehydration of the paginator on that message, kept until it stops
+        # so that clicks which arrive while it is being rehydrated share the same paginator.
+        self._rehydrated: dict[int, asyncio.Task[BasePaginator[Any, Any] | None]] = {}
+
+    def custom_id(self, name: str, /) -> str:
+        return f"{self.prefix}:{name}"
+
+    def setup(self, client: discord.Client, /) -> None:
+        client.add_view(_RehydrationView(self))
+
+    # state
+
+    async def save(self, paginator: BasePaginator[Any, Any], /) -> None:
+        if paginator.message is None or paginator.persistence_key is None:
+            return
+        await self.store.set(
+            PaginatorState(
+                message_id=paginator.message.id,
+                channel_id=paginator.message.channel.id,
+                guild_id=paginator.message.guild.id if paginator.message.guild is not None else None,
+                author_id=paginator.author_id,
+                page=paginator.page,
+                key=paginator.persistence_key,
+            )
+        )
+
+    async def delete(self, paginator: BasePaginator[Any, Any], /) -> None:
+        if paginator.message is None:
+            return
+        self._rehydrated.pop(paginator.message.id, None)
+        await self.store.delete(paginator.message.id)
+
+    # rehydration
+
+    async def rehydrate(self, interaction: discord.Interaction, /) -> BasePaginator[Any, Any] | None:
+        if interaction.message is None:
+            return None
+        message_id = interaction.message.id
+        if (task := self._rehydrated.get(message_id)) is None:
+            task = asyncio.create_task(self._rehydrate(interaction.message, interaction))
+            self._rehydrated[message_id] = task
+        try:
+            paginator = await asyncio.shield(task)
+        except Exception:
+            self._rehydrated.pop(message_id, None)
+            raise
+        if paginator is None:
+            self._rehydrated.pop(message_id, None)
+            return None
+        if paginator.author_id != interaction.user.id:
+            return None
+        return paginator
+
+    async def _rehydrate(
+        self,
+        message: discord.Message,
+        interaction: discord.Interaction,
+        /,
+    ) -> BasePaginator[Any, Any] | None:
+        if (state := await self.store.get(message.id)) is None:
+            return None
+        paginator = await self.factory(state, interaction)
+        paginator.author_id = state.author_id
+        await paginator.resume(message, page=state.page)
+        return paginator
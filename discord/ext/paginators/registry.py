@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import discord
+from discord.ext import commands
+
+if TYPE_CHECKING:
+    from .paginators import BasePaginator
+    from .types import PaginatorStopCallback
+
+
+__all__ = [
+    "PaginatorRegistry",
+    "default_registry",
+]
+
+
+class PaginatorRegistry:
+
+    def __init__(self, *, max_per_user: int | None = None) -> None:
+        if max_per_user is not None and max_per_user <= 0:
+            raise ValueError("'max_per_user' must be greater than 0.")
+        self.max_per_user: int | None = max_per_user
+        # paginator -> (user id, guild id, channel id, message id), in order of registration.
+        self._paginators: dict[BasePaginator[Any, Any], tuple[int, int | None, int | None, int | None]] = {}
+        self._users: dict[int, dict[BasePaginator[Any, Any], None]] = {}
+        self._guilds: dict[int | None, dict[BasePaginator[Any, Any], None]] = {}
+        self._channels: dict[int | None, dict[BasePaginator[Any, Any], None]] = {}
+        self._messages: dict[int, BasePaginator[Any, Any]] = {}
+        self._attached: set[commands.Bot] = set()
+        # expiry scheduling, outdated heap entries are skipped by comparing them against
+        # the paginators current deadline when they are popped.
+        self._deadlines: dict[BasePaginator[Any, Any], float] = {}
+        self._heap: list[tuple[float, int, BasePaginator[Any, Any]]] = []
+        self._counter: itertools.count[int] = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._scheduler: asyncio.Task[None] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._paginators)
+
+    def __contains__(self, paginator: BasePaginator[Any, Any], /) -> bool:
+        return paginator in self._paginators
+
+    # tracking
+
+    def register(self, paginator: BasePaginator[Any, Any], /) -> None:
+        if paginator in self._paginators:
+            return
+        user_id = paginator.author_id
+        guild_id = paginator.ctx.guild.id if paginator.ctx.guild is not None else None
+        # evict the users oldest paginators if they are over the limit
+        if self.max_per_user is not None:
+            users = self._users.get(user_id, {})
+            for oldest in list(users)[:max(len(users) - self.max_per_user + 1, 0)]:
+                self.unregister(oldest)
+                self._spawn(oldest.stop(callback=oldest.on_timeout))
+        channel_id = paginator.message.channel.id if paginator.message is not None else None
+        message_id = paginator.message.id if paginator.message is not None else None
+        self._paginators[paginator] = (user_id, guild_id, channel_id, message_id)
+        self._users.setdefault(user_id, {})[paginator] = None
+        self._guilds.setdefault(guild_id, {})[paginator] = None
+        self._channels.setdefault(channel_id, {})[paginator] = None
+        if message_id is not None:
+            self._messages[message_id] = paginator
+        self.refresh(paginator)
+
+    def unregister(self, paginator: BasePaginator[Any, Any], /) -> None:
+        if (owner := self._paginators.pop(paginator, None)) is None:
+            return
+        user_id, guild_id, channel_id, message_id = owner
+        self._remove_from_index(self._users, user_id, paginator)
+        self._remove_from_index(self._guilds, guild_id, paginator)
+        self._remove_from_index(self._channels, channel_id, paginator)
+        if message_id is not None and self._messages.get(message_id) is paginator:
+            del self._messages[message_id]
+        self._deadlines.pop(paginator, None)
+
+    def refresh(self, paginator: BasePaginator[Any, Any], /) -> None:
+        # shared paginators time out through their own view, they are only tracked here
+        if paginator not in self._paginators or paginator.shared:
+            return
+        deadline = asyncio.get_running_loop().time() + paginator.timeout
+        self._deadlines[paginator] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), paginator))
+        # drop outdated entries once they start to outnumber the live ones
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            self._heap = [
+                entry for entry in self._heap
+                if self._deadlines.get(entry[2]) == entry[0]
+            ]
+            heapq.heapify(self._heap)
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.create_task(self._run_scheduler())
+        elif self._wakeup is not None and self._heap[0][2] is paginator:
+            self._wakeup.set()
+
+    # cleanup
+
+    def attach(self, bot: commands.Bot, /) -> None:
+        # a single set of listeners serves every paginator in the registry, looking them up
+        # by message, channel, or guild id rather than each paginator listening on its own.
+        if bot in self._attached:
+            return
+        bot.add_listener(self._on_raw_message_delete, "on_raw_message_delete")
+        bot.add_listener(self._on_raw_bulk_message_delete, "on_raw_bulk_message_delete")
+        bot.add_listener(self._on_guild_channel_delete, "on_guild_channel_delete")
+        bot.add_listener(self._on_raw_thread_delete, "on_raw_thread_delete")
+        bot.add_listener(self._on_guild_remove, "on_guild_remove")
+        self._attached.add(bot)
+
+    def detach(self, bot: commands.Bot, /) -> None:
+        if bot not in self._attached:
+            return
+        bot.remove_listener(self._on_raw_message_delete, "on_raw_message_delete")
+        bot.remove_listener(self._on_raw_bulk_message_delete, "on_raw_bulk_message_delete")
+        bot.remove_listener(self._on_guild_channel_delete, "on_guild_channel_delete")
+        bot.remove_listener(self._on_raw_thread_delete, "on_raw_thread_delete")
+        bot.remove_listener(self._on_guild_remove, "on_guild_remove")
+        self._attached.discard(bot)
+
+    def discard(self, paginators: Iterable[BasePaginator[Any, Any]], /) -> None:
+        # the messages are already gone, so stop without the stop callback trying to edit them
+        for paginator in list(paginators):
+            self.unregister(paginator)
+            self._spawn(paginator.stop(callback=_discard))
+
+    async def _on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent, /) -> None:
+        if (paginator := self._messages.get(payload.message_id)) is not None:
+            self.discard((paginator,))
+
+    async def _on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent, /) -> None:
+        self.discard(
+            paginator for message_id in payload.message_ids
+            if (paginator := self._messages.get(message_id)) is not None
+        )
+
+    async def _on_guild_channel_delete(self, channel: discord.abc.GuildChannel, /) -> None:
+        self.discard(self._channels.get(channel.id, ()))
+
+    async def _on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent, /) -> None:
+        self.discard(self._channels.get(payload.thread_id, ()))
+
+    async def _on_guild_remove(self, guild: discord.Guild, /) -> None:
+        self.discard(self._guilds.get(guild.id, ()))
+
+    # querying
+
+    def get_paginators(
+        self,
+        *,
+        user_id: int | None = None,
+        guild_id: int | None = None,
+    ) -> list[BasePaginator[Any, Any]]:
+        if user_id is not None:
+            paginators = list(self._users.get(user_id, ()))
+            if guild_id is not None:
+                paginators = [p for p in paginators if self._paginators[p][1] == guild_id]
+            return paginators
+        if guild_id is not None:
+            return list(self._guilds.get(guild_id, ()))
+        return list(self._paginators)
+
+    def count(self, *, user_id: int | None = None, guild_id: int | None = None) -> int:
+        if user_id is None and guild_id is None:
+            return len(self._paginators)
+        if user_id is None:
+            return len(self._guilds.get(guild_id, ()))
+        if guild_id is None:
+            return len(self._users.get(user_id, ()))
+        return len(self.get_paginators(user_id=user_id, guild_id=guild_id))
+
+    def counts_by_guild(self) -> dict[int | None, int]:
+        return {guild_id: len(paginators) for guild_id, paginators in self._guilds.items()}
+
+    def counts_by_user(self) -> dict[int, int]:
+        return {user_id: len(paginators) for user_id, paginators in self._users.items()}
+
+    # stopping
+
+    async def stop_all(self, *, callback: PaginatorStopCallback | None = None) -> None:
+        paginators = list(self._paginators)
+        await asyncio.gather(
+            *(paginator.stop(callback=callback or paginator.on_timeout) for paginator in paginators),
+            return_exceptions=True,
+        )
+        for paginator in paginators:
+            self.unregister(paginator)
+
+    # internal
+
+    @staticmethod
+    def _remove_from_index(
+        index: dict[Any, dict[BasePaginator[Any, Any], None]],
+        key: Any,
+        paginator: BasePaginator[Any, Any],
+        /,
+    ) -> None:
+        paginators = index.get(key)
+        if paginators is None:
+            return
+        paginators.pop(paginator, None)
+        if not paginators:
+            del index[key]
+
+    def _spawn(self, coroutine: Any, /) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_scheduler(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._wakeup = wakeup = asyncio.Event()
+        while self._heap:
+            deadline, _, paginator = self._heap[0]
+            if (delay := deadline - loop.time()) > 0:
+                wakeup.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), delay)
+                continue
+            heapq.heappop(self._heap)
+            if self._deadlines.get(paginator) != deadline:
+                continue
+            self.unregister(paginator)
+            if paginator.view is not discord.utils.MISSING:
+                self._spawn(paginator.view.on_timeout())
+
+
+async def _discard(paginator: BasePaginator[Any, Any]) -> None:
+    return
+
+
+default_registry: PaginatorRegistry = PaginatorRegistry()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from .pages import BasePages
+
+
+__all__ = [
+    "PageRenderer",
+    "format_page",
+    "format_items",
+    "page_length_budget",
+    "render_text_page",
+]
+
+
+T = TypeVar("T")
+
+
+def format_page(codeblock_start: str, header: str, page: str, footer: str, codeblock_end: str, /) -> str:
+    # module level so that it can be sent to a process pool
+    return f"{codeblock_start}{header}\n{page}\n{footer}{codeblock_end}"
+
+
+def format_items(
+    items: Sequence[str],
+    join_items_with: str,
+    codeblock_start: str,
+    header: str,
+    footer: str,
+    codeblock_end: str,
+    /,
+) -> str:
+    # builds a page from its items and formats it in one go, so that pages which aren't
+    # built yet don't have to be joined on the event loop before being sent to a renderer.
+    return format_page(codeblock_start, header, join_items_with.join(items), footer, codeblock_end)
+
+
+def page_length_budget(
+    max_page_length: int | None,
+    codeblock_start: str,
+    header: str,
+    footer: str,
+    codeblock_end: str,
+    /,
+) -> int | None:
+    if max_page_length is None:
+        return None
+    # leave room for everything that gets wrapped around the joined items of a page.
+    max_page_length -= len(format_page(codeblock_start, header, "", footer, codeblock_end))
+    if max_page_length <= 0:
+        raise ValueError("'max_page_length' is too small to fit the header, footer, and codeblock.")
+    return max_page_length
+
+
+async def render_text_page(
+    pages: BasePages,
+    index: int,
+    renderer: PageRenderer | None,
+    codeblock_start: str,
+    header: str,
+    footer: str,
+    codeblock_end: str,
+    /,
+) -> str:
+    if renderer is None:
+        return format_page(codeblock_start, header, pages[index], footer, codeblock_end)
+    # pages that aren't built yet are joined by the renderer along with being formatted
+    if pages.join_items and (items := pages.unbuilt_items(index)) is not None:
+        return await renderer.render(
+            format_items, items, pages.join_items_with, codeblock_start, header, footer, codeblock_end
+        )
+    return await renderer.render(format_page, codeblock_start, header, pages[index], footer, codeblock_end)
+
+
+class PageRenderer:
+
+    def __init__(
+        self,
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        max_concurrent_renders: int = 4,
+        max_pending: int | None = 64,
+    ) -> None:
+        if max_concurrent_renders <= 0:
+            raise ValueError("'max_concurrent_renders' must be greater than 0.")
+        if max_pending is not None and max_pending <= 0:
+            raise ValueError("'max_pending' must be greater than 0.")
+        # 'None' uses the event loops default thread pool. process pools need the functions
+        # and arguments they are given to be picklable.
+        self.executor: concurrent.futures.Executor | None = executor
+        self.max_concurrent_renders: int = max_concurrent_renders
+        # renders past 'max_concurrent_renders' wait here rather than queueing up in the
+        # executor, so a spike of paginators can't flood it with work.
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_renders)
+        # renders past 'max_pending' are rejected rather than waiting, so that a backlog the
+        # executor can't keep up with fails fast instead of growing (and never on the loop).
+        self.max_pending: int | None = max_pending
+        # renders that are either running or waiting for their turn, and those that were
+        # rejected because too many were pending.
+        self.pending: int = 0
+        self.rejected_renders: int = 0
+
+    async def render(self, function: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        if self.max_pending is not None and self.pending >= self.max_pending:
+            self.rejected_renders += 1
+            raise RuntimeError(f"Too many renders are pending, the renderer allows at most {self.max_pending}.")
+        self.pending += 1
+        try:
+            async with self._semaphore:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self.executor, functools.partial(function, *args, **kwargs)
+                )
+        finally:
+            self.pending -= 1
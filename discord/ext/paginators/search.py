@@ -0,0 +1,99 @@
+import bisect
+import re
+
+
+__all__ = ["SearchIndex"]
+
+
+_TOKEN: re.Pattern[str] = re.compile(r"\w+")
+
+
+class SearchIndex:
+
+    def __init__(self) -> None:
+        # token -> pages containing it, in ascending order as pages are added in order.
+        self._postings: dict[str, list[int]] = {}
+        # the indexed words sorted, sorted by their reverse, and joined together, for finding
+        # the words that start with, end with, or contain a token. built on the first partial
+        # lookup after new words were added.
+        self._words: list[str] | None = None
+        self._reversed_words: list[str] | None = None
+        self._joined_words: str = ""
+        self._offsets: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def add(self, page: int, text: str, /) -> None:
+        for token in set(_TOKEN.findall(text.lower())):
+            if (postings := self._postings.get(token)) is None:
+                postings = self._postings[token] = []
+                self._words = self._reversed_words = None
+            if not postings or postings[-1] < page:
+                postings.append(page)
+
+    def candidates(self, term: str, /, *, partial: bool = False) -> list[int] | None:
+        # returns None if the term has no words in it to look up, in which case every
+        # page is a candidate. with 'partial', the words at the start and end of the term
+        # may also be the end and start of longer words ("layer" in "player").
+        term = term.lower()
+        matches = list(_TOKEN.finditer(term))
+        if not matches:
+            return None
+        postings: list[list[int]] = []
+        for match in matches:
+            token = match.group()
+            longer_before = partial and match.start() == 0
+            longer_after = partial and match.end() == len(term)
+            if not longer_before and not longer_after:
+                postings.append(self._postings.get(token, []))
+                continue
+            if longer_before and longer_after:
+                words = self._words_containing(token)
+            elif longer_before:
+                words = self._words_ending_with(token)
+            else:
+                words = self._words_starting_with(token)
+            postings.append(sorted({page for word in words for page in self._postings[word]}))
+        postings.sort(key=len)
+        others = [set(posting) for posting in postings[1:]]
+        return [page for page in postings[0] if all(page in other for other in others)]
+
+    # partial lookups
+
+    def _build_words(self) -> list[str]:
+        if self._words is None:
+            self._words = sorted(self._postings)
+            self._reversed_words = sorted(word[::-1] for word in self._words)
+            self._joined_words = "\0".join(self._words)
+            self._offsets = [0]
+            for word in self._words[:-1]:
+                self._offsets.append(self._offsets[-1] + len(word) + 1)
+        return self._words
+
+    def _words_starting_with(self, token: str, /) -> list[str]:
+        words = self._build_words()
+        start = bisect.bisect_left(words, token)
+        end = bisect.bisect_left(words, f"{token}\U0010ffff", lo=start)
+        return words[start:end]
+
+    def _words_ending_with(self, token: str, /) -> list[str]:
+        self._build_words()
+        assert self._reversed_words is not None
+        words, token = self._reversed_words, token[::-1]
+        start = bisect.bisect_left(words, token)
+        end = bisect.bisect_left(words, f"{token}\U0010ffff", lo=start)
+        return [word[::-1] for word in words[start:end]]
+
+    def _words_containing(self, token: str, /) -> list[str]:
+        words = self._build_words()
+        found: list[str] = []
+        index = self._joined_words.find(token)
+        while index != -1:
+            # skip to the next word after a match, so each word is only found once
+            position = bisect.bisect_right(self._offsets, index) - 1
+            found.append(words[position])
+            if position + 1 == len(words):
+                break
+            index = self._joined_words.find(token, self._offsets[position + 1])
+        return found
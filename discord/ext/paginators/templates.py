@@ -0,0 +1,58 @@
+import json
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+import discord
+
+from .caches import BaseCache, RenderCache
+
+
+__all__ = [
+    "EmbedTemplate",
+    "default_template_cache",
+]
+
+
+class EmbedTemplate:
+
+    __slots__ = (
+        "data",
+        "cache",
+    )
+
+    def __init__(self, embed: discord.Embed, /, *, cache: BaseCache | None = None) -> None:
+        # the static parts of the embed (author, footer, colour, ...) are only converted once,
+        # each page is then a shallow merge of its description or fields into them.
+        self.data: dict[str, Any] = dict(embed.to_dict())
+        self.cache: BaseCache = cache if cache is not None else default_template_cache
+
+    def render(
+        self,
+        *,
+        description: str | None = None,
+        fields: Sequence[tuple[str, str, bool]] | None = None,
+        image: str | None = None,
+    ) -> tuple[discord.Embed, str]:
+        # rendered embeds are shared by every paginator using this template, so they must
+        # not be mutated. they are returned along with their serialised form, which is
+        # what paginators compare to decide whether an edit is needed. the template is part
+        # of the key so that one cache can be shared between templates.
+        key: Hashable = (self, description, tuple(fields) if fields is not None else None, image)
+        if (rendered := self.cache.get(key)) is not None:
+            return rendered
+        data = self.data.copy()
+        if description is not None:
+            data["description"] = description
+        if fields is not None:
+            data["fields"] = [{"name": name, "value": value, "inline": inline} for name, value, inline in fields]
+        elif "fields" in data:
+            data["fields"] = list(data["fields"])
+        if image is not None:
+            data["image"] = {"url": image}
+        embed = discord.Embed.from_dict(data)
+        rendered = (embed, json.dumps([embed.to_dict()], sort_keys=True))
+        self.cache.set(key, rendered)
+        return rendered
+
+
+default_template_cache: RenderCache = RenderCache(max_entries=1024)
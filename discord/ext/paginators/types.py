@@ -1,12 +1,14 @@
 from collections.abc import Awaitable, Callable
 from typing import Any, TYPE_CHECKING, TypeAlias
 
+import discord
 from discord.ext import commands
 from typing_extensions import TypeVar
 
 if TYPE_CHECKING:
     from .controllers import BaseController, DefaultController
     from .paginators import BasePaginator
+    from .persistence import PaginatorState
 
 
 __all__ = [
@@ -14,12 +16,13 @@ __all__ = [
     "ControllerT",
     "PaginatorT",
     "PaginatorStopCallback",
+    "PaginatorFactory",
 ]
 
 
 ContextT = TypeVar(
     "ContextT",
-    bound=commands.Context[Any],
+    bound=commands.Context[Any] | discord.Interaction[Any],
     default=commands.Context[Any],
     covariant=True,
 )
@@ -37,3 +40,4 @@ PaginatorT = TypeVar(
 )
 
 PaginatorStopCallback: TypeAlias = Callable[[PaginatorT], Awaitable[None]]
+PaginatorFactory: TypeAlias = Callable[["PaginatorState", discord.Interaction], Awaitable["BasePaginator[Any, Any]"]]